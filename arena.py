@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Doubly linked list whose links live in parallel integer arrays.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Doubly linked list whose links live in parallel integer arrays.
+"""
+
+# Generic/Built-in
+from array import array
+from typing import Iterable, Iterator, Union
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+# Slot index standing for a missing link.
+NIL = -1
+
+_MISSING = object()
+
+
+class ArenaLinkedList:
+    """
+    Doubly linked list whose nodes are slots in parallel arrays.
+
+    Has the same interface and error semantics as `DoublyLinkedList`, including
+    negative indexing. `next` and `prev` links are `array('q')` slot indexes and
+    values sit in a slot-indexed buffer; removed slots go on a free list and are
+    reused by later insertions, so no per-element objects are allocated.
+    """
+
+    def __init__(self, x: Iterable = None) -> None:
+        self.__size: int = 0
+        self.shape: tuple = tuple([self.__size])
+        self._next = array("q")
+        self._prev = array("q")
+        self._values = self._new_values()
+        self._free: list = []
+        self._head: int = NIL
+        self._tail: int = NIL
+        # Last slot reached by a positional walk and its index.
+        self.__finger: int = NIL
+        self.__finger_index: int = 0
+        if x:
+            self.extend(x)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self) -> Iterator:
+        _next, values = self._next, self._values
+        slot = self._head
+        while slot != NIL:
+            yield values[slot]
+            slot = _next[slot]
+
+    def __reversed__(self) -> Iterator:
+        _prev, values = self._prev, self._values
+        slot = self._tail
+        while slot != NIL:
+            yield values[slot]
+            slot = _prev[slot]
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def _new_values(self):
+        """
+        Returns an empty value buffer.
+        """
+        return []
+
+    def _allocate(self, x) -> int:
+        """
+        Returns a detached slot holding `x`, reusing a freed slot when there is one.
+        """
+        if self._free:
+            slot = self._free[-1]
+            self._values[slot] = x
+            self._free.pop()
+            self._next[slot] = NIL
+            self._prev[slot] = NIL
+            return slot
+        self._values.append(x)
+        self._next.append(NIL)
+        self._prev.append(NIL)
+        return len(self._values) - 1
+
+    def _release(self, slot: int) -> None:
+        """
+        Puts a detached `slot` on the free list, dropping its value.
+        """
+        self._values[slot] = None
+        self._free.append(slot)
+
+    def __slot_at(self, index: int) -> int:
+        """
+        Returns the slot at an in-range, non-negative `index`.
+
+        Walks from whichever of the head, the tail and the finger is closest to `index`.
+        """
+        slot = self._head
+        count = 0
+        distance = index
+        if self.__size - 1 - index < distance:
+            slot = self._tail
+            count = self.__size - 1
+            distance = count - index
+        if self.__finger != NIL and abs(index - self.__finger_index) < distance:
+            slot = self.__finger
+            count = self.__finger_index
+        _next, _prev = self._next, self._prev
+        while count < index:
+            slot = _next[slot]
+            count += 1
+        while count > index:
+            slot = _prev[slot]
+            count -= 1
+        self.__finger = slot
+        self.__finger_index = index
+        return slot
+
+    def size(self) -> int:
+        """
+        Returns the size of the linked list.
+        """
+        return self.__size
+
+    def get(self, index: int):
+        """
+        Returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; raises `IndexError` if `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if abs(index) > self.__size or index >= self.__size:
+            raise IndexError("linked list index out of range")
+        if index < 0:
+            index += self.__size
+        return self._values[self.__slot_at(index)]
+
+    def index(self, x) -> int:
+        """
+        Returns the index of the first occurrence of an element `x` in the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        for index, value in enumerate(self):
+            if x == value:
+                return index
+        raise ValueError(
+            f"{repr(x) if isinstance(x, str) else x} is not in linked list"
+        )
+
+    def append(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list.
+        """
+        slot = self._allocate(x)
+        if self._tail == NIL:
+            self._head = slot
+        else:
+            self._prev[slot] = self._tail
+            self._next[self._tail] = slot
+        self._tail = slot
+        self.__size += 1
+        self.shape = tuple([self.__size])
+
+    def insert(self, index: int, x) -> None:
+        """
+        Adds an element `x` at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `insert()` method of list.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0:
+            index = max(index + self.__size, 0)
+        if index >= self.__size:
+            self.append(x)
+            return
+        current = self.__slot_at(index)
+        slot = self._allocate(x)
+        previous = self._prev[current]
+        self._next[slot] = current
+        self._prev[slot] = previous
+        if previous != NIL:
+            self._next[previous] = slot
+        else:
+            self._head = slot
+        self._prev[current] = slot
+        self.__finger = slot
+        self.__size += 1
+        self.shape = tuple([self.__size])
+
+    def pop(self, index: Union[int, None] = None):
+        """
+        Removes and returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `pop()` method of list.
+
+        Raises `IndexError` if `index` is out of range.
+        """
+        if index is not None and not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if self._head == NIL:
+            raise IndexError("pop from empty linked list")
+        if index is None:
+            index = self.__size - 1
+        elif index < 0:
+            if abs(index) > self.__size:
+                raise IndexError("pop index out of range")
+            index += self.__size
+        elif index >= self.__size:
+            raise IndexError("pop index out of range")
+        slot = self.__slot_at(index)
+        previous, following = self._prev[slot], self._next[slot]
+        if previous != NIL:
+            self._next[previous] = following
+            self.__finger = previous
+            self.__finger_index = index - 1
+        else:
+            self._head = following
+            self.__finger = following
+        if following != NIL:
+            self._prev[following] = previous
+        else:
+            self._tail = previous
+        value = self._values[slot]
+        self._release(slot)
+        self.__size -= 1
+        self.shape = tuple([self.__size])
+        return value
+
+    def remove(self, x) -> None:
+        """
+        Removes an element `x` from the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        self.pop(self.index(x))
+
+    def extend(self, x: Iterable) -> None:
+        "Adds the element(s) of a linked list or an iterable `x` at the end of an existing linked list."
+        if not isinstance(x, Iterable):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        iterator = iter(x)
+        while self._free:
+            element = next(iterator, _MISSING)
+            if element is _MISSING:
+                return
+            self.append(element)
+        # Remaining elements take consecutive new slots, linked in bulk.
+        chunk = self._new_values()
+        chunk.extend(iterator)
+        count = len(chunk)
+        if not count:
+            return
+        start = len(self._values)
+        self._values.extend(chunk)
+        self._next.extend(range(start + 1, start + count + 1))
+        self._next[-1] = NIL
+        self._prev.extend(range(start - 1, start + count - 1))
+        self._prev[start] = self._tail
+        if self._tail != NIL:
+            self._next[self._tail] = start
+        else:
+            self._head = start
+        self._tail = start + count - 1
+        self.__size += count
+        self.shape = tuple([self.__size])
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the elements in the linked list.
+
+        Swaps the link arrays, so it runs in O(1).
+        """
+        self._next, self._prev = self._prev, self._next
+        self._head, self._tail = self._tail, self._head
+        if self.__finger != NIL:
+            self.__finger_index = self.__size - 1 - self.__finger_index
+
+    def _adopt(self, values) -> None:
+        """
+        Replaces the contents with the value buffer `values`, slot `i` becoming index `i`.
+        """
+        count = len(values)
+        self._values = values
+        self._next = array("q", range(1, count + 1))
+        if count:
+            self._next[-1] = NIL
+        self._prev = array("q", range(-1, count - 1))
+        self._free = []
+        self._head = 0 if count else NIL
+        self._tail = count - 1
+        self.__finger = NIL
+        self.__size = count
+        self.shape = tuple([self.__size])
+
+    def compact(self) -> None:
+        """
+        Renumbers the slots in list order and drops the free list.
+
+        Afterwards slot `i` holds the element at index `i`.
+        """
+        values = self._new_values()
+        values.extend(self)
+        self._adopt(values)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Asyncio linked list with awaitable pops and bounded appends.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Asyncio linked list with awaitable pops and bounded appends.
+"""
+
+# Generic/Built-in
+import asyncio
+from collections import deque
+from typing import Callable, Iterable, Iterator, Union
+
+# Owned
+from linkedlist import DoublyLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+
+class AsyncLinkedList:
+    """
+    `DoublyLinkedList` for passing elements between coroutines of one event loop.
+
+    `await pop()`, `await popleft()` and `await drain()` suspend until an element is
+    available, and with a positive `maxsize` `await append()` suspends while the linked list
+    is full. Waiting coroutines park on futures, woken one at a time in arrival order as
+    `asyncio.Queue` does, so nothing polls. The `_nowait` methods never suspend and raise
+    `IndexError` instead. Not thread-safe, like the rest of asyncio.
+    """
+
+    def __init__(self, x: Iterable = None, maxsize: int = 0) -> None:
+        if not isinstance(maxsize, int):
+            raise TypeError(
+                f"'{type(maxsize).__name__}' object cannot be interpreted as an integer"
+            )
+        self.__list = DoublyLinkedList(x)
+        self.__maxsize: int = maxsize
+        self.__getters: deque = deque()
+        self.__putters: deque = deque()
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Number of elements the linked list holds before `append()` waits; `0` means unbounded.
+        """
+        return self.__maxsize
+
+    @property
+    def shape(self) -> tuple:
+        return self.__list.shape
+
+    def __len__(self) -> int:
+        return len(self.__list)
+
+    def __contains__(self, x) -> bool:
+        return x in self.__list
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__list)
+
+    def __str__(self) -> str:
+        return str(self.__list)
+
+    @staticmethod
+    def __wakeup_next(waiters: deque) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def __wait(self, waiters: deque, blocked: Callable[[], bool]) -> None:
+        """
+        Suspends until `blocked()` is false, parking a future in `waiters` meanwhile.
+
+        A cancelled waiter passes its wakeup on, so an element is never left unclaimed.
+        """
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self.__wakeup_next(waiters)
+                raise
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the linked list.
+        """
+        return len(self.__list)
+
+    def empty(self) -> bool:
+        """
+        Returns `True` if the linked list has no elements.
+        """
+        return not self.__list
+
+    def full(self) -> bool:
+        """
+        Returns `True` if the linked list holds `maxsize` elements; never for an unbounded one.
+        """
+        return 0 < self.__maxsize <= len(self.__list)
+
+    def append_nowait(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list.
+
+        Raises `IndexError` if the linked list is full.
+        """
+        if self.full():
+            raise IndexError("append to full linked list")
+        self.__list.append(x)
+        self.__wakeup_next(self.__getters)
+
+    async def append(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list, waiting while it is full.
+        """
+        await self.__wait(self.__putters, self.full)
+        self.append_nowait(x)
+
+    def pop_nowait(self):
+        """
+        Removes and returns the last element of the linked list.
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        value = self.__list.pop()
+        self.__wakeup_next(self.__putters)
+        return value
+
+    async def pop(self):
+        """
+        Removes and returns the last element of the linked list, waiting while it is empty.
+        """
+        await self.__wait(self.__getters, self.empty)
+        return self.pop_nowait()
+
+    def popleft_nowait(self):
+        """
+        Removes and returns the first element of the linked list.
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        value = self.__list.popleft()
+        self.__wakeup_next(self.__putters)
+        return value
+
+    async def popleft(self):
+        """
+        Removes and returns the first element of the linked list, waiting while it is empty.
+        """
+        await self.__wait(self.__getters, self.empty)
+        return self.popleft_nowait()
+
+    def drain_nowait(self, n: Union[int, None] = None) -> list:
+        """
+        Removes and returns up to `n` elements from the beginning of the linked list,
+        or all of them if `n` is `None`; returns an empty list if there are none.
+        """
+        if n is not None and not isinstance(n, int):
+            raise TypeError(
+                f"'{type(n).__name__}' object cannot be interpreted as an integer"
+            )
+        count = len(self.__list) if n is None else min(max(n, 0), len(self.__list))
+        popleft = self.__list.popleft
+        values = [popleft() for _ in range(count)]
+        for _ in range(count):
+            if not self.__putters:
+                break
+            self.__wakeup_next(self.__putters)
+        return values
+
+    async def drain(self, n: Union[int, None] = None) -> list:
+        """
+        Removes and returns up to `n` elements from the beginning of the linked list,
+        or all of them if `n` is `None`, waiting until there is at least one.
+
+        Moving elements in batches amortizes the suspension over the whole batch.
+        Raises `ValueError` if `n` is less than 1.
+        """
+        if n is not None and not isinstance(n, int):
+            raise TypeError(
+                f"'{type(n).__name__}' object cannot be interpreted as an integer"
+            )
+        if n is not None and n < 1:
+            raise ValueError("n must be positive")
+        await self.__wait(self.__getters, self.empty)
+        values = self.drain_nowait(n)
+        if self.__list:
+            # The wakeup that let this drain in may have been meant for a remaining element.
+            self.__wakeup_next(self.__getters)
+        return values
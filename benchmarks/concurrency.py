@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Multithreaded stress test and throughput of ConcurrentLinkedList.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Multithreaded stress test and throughput of ConcurrentLinkedList.
+
+Every run has producers appending tagged elements and consumers draining them; the
+stress check verifies that each element arrives exactly once and that each consumer
+sees every producer's elements in order.
+
+Run from the repository root:
+
+    python -m benchmarks.concurrency [THREADS ...] [--ops N]
+"""
+
+# Generic/Built-in
+import argparse
+import queue
+import threading
+import time
+
+# Owned
+from concurrentlist import ConcurrentLinkedList
+from linkedlist import DoublyLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+THREADS = [1, 2, 4, 8]
+
+_DONE = object()
+
+
+class LockedLinkedList:
+    """
+    `DoublyLinkedList` behind one global lock and condition, the baseline being replaced.
+    """
+
+    def __init__(self) -> None:
+        self.__list = DoublyLinkedList()
+        self.__ready = threading.Condition(threading.Lock())
+
+    def append(self, x) -> None:
+        with self.__ready:
+            self.__list.append(x)
+            self.__ready.notify()
+
+    def popleft(self, timeout: float = None):
+        with self.__ready:
+            if not self.__ready.wait_for(lambda: len(self.__list), timeout):
+                raise IndexError("pop from empty linked list")
+            return self.__list.popleft()
+
+
+class QueueAdapter:
+    """
+    `queue.Queue` with the `append()`/`popleft()` interface, for reference.
+    """
+
+    def __init__(self) -> None:
+        self.__queue = queue.Queue()
+
+    def append(self, x) -> None:
+        self.__queue.put(x)
+
+    def popleft(self, timeout: float = None):
+        try:
+            return self.__queue.get(timeout=timeout)
+        except queue.Empty:
+            raise IndexError("pop from empty linked list") from None
+
+
+def run(cls, threads: int, ops: int) -> float:
+    """
+    Runs `threads` producers and `threads` consumers over `ops` elements in total,
+    checks the delivery guarantees and returns the elements moved per second.
+    """
+    shared = cls()
+    per_producer = ops // threads
+    received = [[] for _ in range(threads)]
+
+    def produce(producer: int) -> None:
+        for i in range(per_producer):
+            shared.append((producer, i))
+
+    def consume(consumer: int) -> None:
+        out = received[consumer]
+        while True:
+            element = shared.popleft(timeout=10)
+            if element is _DONE:
+                return
+            out.append(element)
+
+    producers = [threading.Thread(target=produce, args=(p,)) for p in range(threads)]
+    consumers = [threading.Thread(target=consume, args=(c,)) for c in range(threads)]
+    start = time.perf_counter()
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        shared.append(_DONE)
+    for thread in consumers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    seen = sorted(element for out in received for element in out)
+    expected = [(p, i) for p in range(threads) for i in range(per_producer)]
+    assert seen == expected, f"{cls.__name__}: lost or duplicated elements"
+    for out in received:
+        last = {}
+        for producer, i in out:
+            assert last.get(producer, -1) < i, f"{cls.__name__}: out of order"
+            last[producer] = i
+    return per_producer * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("threads", nargs="*", type=int, default=THREADS)
+    parser.add_argument("--ops", type=int, default=200_000, help="elements per run")
+    args = parser.parse_args()
+    classes = [LockedLinkedList, ConcurrentLinkedList, QueueAdapter]
+    print(f"{'threads':>8}" + "".join(f"{cls.__name__:>22}" for cls in classes))
+    for threads in args.threads:
+        rates = [run(cls, threads, args.ops) for cls in classes]
+        print(f"{threads:>8}" + "".join(f"{rate:>22,.0f}" for rate in rates))
+    print("(elements per second; each thread count is producers and consumers each)")
+
+
+if __name__ == "__main__":
+    main()
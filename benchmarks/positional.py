@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Positional get/insert/pop: IndexableSkipList against DoublyLinkedList.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Positional get/insert/pop: IndexableSkipList against DoublyLinkedList.
+
+Run from the repository root:
+
+    python -m benchmarks.positional [SIZE ...] [--ops N]
+"""
+
+# Generic/Built-in
+import argparse
+import random
+import time
+
+# Owned
+from linkedlist import DoublyLinkedList
+from skiplist import IndexableSkipList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+SIZES = [10**4, 10**5, 10**6, 10**7]
+
+
+def bench(cls, size: int, ops: int, seed: int = 0) -> dict:
+    """
+    Returns seconds to build a list of `size` elements and microseconds per random
+    `get`, `insert` and `pop`.
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    linked_list = cls(range(size))
+    results = {"build (s)": time.perf_counter() - start}
+    indexes = [rng.randrange(size) for _ in range(ops)]
+    start = time.perf_counter()
+    for index in indexes:
+        linked_list.get(index)
+    results["get (us)"] = (time.perf_counter() - start) / ops * 1e6
+    start = time.perf_counter()
+    for index in indexes:
+        linked_list.insert(index, index)
+    results["insert (us)"] = (time.perf_counter() - start) / ops * 1e6
+    start = time.perf_counter()
+    for index in indexes:
+        linked_list.pop(index)
+    results["pop (us)"] = (time.perf_counter() - start) / ops * 1e6
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--ops", type=int, default=200, help="operations per size")
+    args = parser.parse_args()
+    columns = ["build (s)", "get (us)", "insert (us)", "pop (us)"]
+    print(f"{'class':<20}{'size':>10}" + "".join(f"{c:>14}" for c in columns))
+    for size in args.sizes:
+        for cls in (DoublyLinkedList, IndexableSkipList):
+            results = bench(cls, size, args.ops)
+            print(
+                f"{cls.__name__:<20}{size:>10}"
+                + "".join(f"{results[c]:>14.2f}" for c in columns)
+            )
+
+
+if __name__ == "__main__":
+    main()
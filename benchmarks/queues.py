@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Producer/consumer loops: linked lists against collections.deque.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Producer/consumer loops: linked lists against collections.deque.
+
+Run from the repository root:
+
+    python -m benchmarks.queues [DEPTH ...] [--ops N] [--drain N ...]
+"""
+
+# Generic/Built-in
+import argparse
+import time
+from collections import deque
+
+# Owned
+from linkedlist import DoublyLinkedList, SinglyLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+DEPTHS = [10**2, 10**4, 10**6]
+DRAINS = [2000, 4000, 8000]
+
+# Labels and constructors of the queues raced against each other.
+QUEUES = {
+    "deque": deque,
+    "SinglyLinkedList": SinglyLinkedList,
+    "SinglyLinkedList stack": lambda x=None: SinglyLinkedList(x, stack=True),
+    "DoublyLinkedList": DoublyLinkedList,
+}
+
+
+def fifo(queue, ops: int) -> None:
+    """
+    Producer appends at the tail, consumer pops at the head.
+    """
+    for i in range(ops):
+        queue.append(i)
+        queue.popleft()
+
+
+def lifo(queue, ops: int) -> None:
+    """
+    Producer and consumer both work at the tail.
+    """
+    for i in range(ops):
+        queue.append(i)
+        queue.pop()
+
+
+def burst(queue, ops: int, batch: int = 100) -> None:
+    """
+    Producer appends a batch, then the consumer drains it from the head.
+    """
+    for _ in range(ops // batch):
+        for i in range(batch):
+            queue.append(i)
+        for _ in range(batch):
+            queue.popleft()
+
+
+def lifo_drain(queue, n: int) -> None:
+    """
+    Producer appends `n` elements, then the consumer pops them all from the same end.
+    """
+    for i in range(n):
+        queue.append(i)
+    while queue:
+        queue.pop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("depths", nargs="*", type=int, default=DEPTHS)
+    parser.add_argument("--ops", type=int, default=100_000, help="operations per run")
+    parser.add_argument(
+        "--drain",
+        type=int,
+        nargs="+",
+        default=DRAINS,
+        help="sizes of the LIFO drain runs",
+    )
+    args = parser.parse_args()
+    loops = [fifo, lifo, burst]
+    print(f"{'class':<24}{'depth':>10}" + "".join(f"{f.__name__:>14}" for f in loops))
+    for depth in args.depths:
+        for label, factory in QUEUES.items():
+            rates = []
+            for loop in loops:
+                queue = factory(range(depth))
+                start = time.perf_counter()
+                loop(queue, args.ops)
+                rates.append(args.ops / (time.perf_counter() - start))
+            print(
+                f"{label:<24}{depth:>10}" + "".join(f"{rate:>14,.0f}" for rate in rates)
+            )
+    print("(operations per second, one append and one pop per operation)")
+    print("(in stack mode every loop appends and pops at the same end)")
+    print()
+    print(f"{'class':<24}" + "".join(f"{n:>14,}" for n in args.drain))
+    for label, factory in QUEUES.items():
+        seconds = []
+        for n in args.drain:
+            queue = factory()
+            start = time.perf_counter()
+            lifo_drain(queue, n)
+            seconds.append(time.perf_counter() - start)
+        print(f"{label:<24}" + "".join(f"{second:>14.4f}" for second in seconds))
+    print("(seconds to append() n elements and then pop() them all)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Benchmark suite: every operation against list and collections.deque.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Benchmark suite: every operation against list and collections.deque.
+
+Times each operation for every class, size and access pattern, and reports operations
+per second, peak traced memory per operation and the complexity that best fits the
+timings across sizes. Results can be saved as a JSON baseline and later runs compared
+against it, flagging slowdowns beyond a threshold.
+
+Run from the repository root:
+
+    python -m benchmarks [SIZE ...] [--classes NAME ...] [--operations NAME ...]
+        [--patterns NAME ...] [--budget SECONDS] [--save FILE] [--compare FILE]
+        [--threshold FRACTION]
+"""
+
+# Generic/Built-in
+import argparse
+import datetime
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+# Owned
+from arena import ArenaLinkedList
+from linkedlist import DoublyLinkedList, SinglyLinkedList
+from skiplist import IndexableSkipList
+from unrolled import UnrolledLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+
+CLASSES = {
+    "list": list,
+    "deque": deque,
+    "singly": SinglyLinkedList,
+    "doubly": DoublyLinkedList,
+    "skiplist": IndexableSkipList,
+    "unrolled": UnrolledLinkedList,
+    "arena": ArenaLinkedList,
+}
+DEFAULT_CLASSES = ["list", "deque", "singly", "doubly"]
+
+PATTERNS = ["head", "tail", "middle", "random", "sequential"]
+
+# Operation -> access patterns it is timed with; "all" marks whole-list operations.
+OPERATIONS = {
+    "construct": ["all"],
+    "str": ["all"],
+    "get": PATTERNS,
+    "index": ["head", "tail", "middle", "random"],
+    "insert": PATTERNS,
+    "pop": PATTERNS,
+    "append": ["tail"],
+    "extend": ["tail"],
+    "reverse": ["all"],
+}
+
+# Upper bound on the operations timed per measurement; `--budget` usually stops sooner.
+MAX_OPS = 10_000
+# Most operations traced for the memory figure, after the timed ones; never more than were timed.
+MEMORY_OPS = 100
+EXTEND_CHUNK = 1000
+
+COMPLEXITIES = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: float(n) * n,
+}
+
+
+def positions(pattern: str, size: int, count: int, growth: int, seed: int = 0) -> list:
+    """
+    Returns `count` indexes following an access `pattern` into a list of `size` elements
+    that grows by `growth` (1, 0 or -1) after every operation.
+
+    For insertions the tail is the position after the last element.
+    """
+    rng = random.Random(seed)
+    result = []
+    for i in range(count):
+        n = size + i * growth
+        last = n if growth > 0 else n - 1
+        if pattern == "head":
+            result.append(0)
+        elif pattern == "tail":
+            result.append(last)
+        elif pattern == "middle":
+            result.append(last // 2)
+        elif pattern == "random":
+            result.append(rng.randint(0, last))
+        else:
+            result.append(i % (last + 1))
+    return result
+
+
+def operation(name: str, container, pattern: str, size: int, count: int):
+    """
+    Returns a function performing the `k`-th of `count` operations `name` on `container`.
+    """
+    if name == "construct":
+        cls, source = type(container), list(range(size))
+        return lambda k: cls(source)
+    if name == "str":
+        return lambda k: str(container)
+    if name == "reverse":
+        return lambda k: container.reverse()
+    if name == "append":
+        return container.append
+    if name == "extend":
+        chunk = list(range(EXTEND_CHUNK))
+        return lambda k: container.extend(chunk)
+    growth = {"insert": 1, "pop": -1}.get(name, 0)
+    indexes = positions(pattern, size, count, growth)
+    if name == "get":
+        get = getattr(container, "get", None) or container.__getitem__
+        return lambda k: get(indexes[k])
+    if name == "index":
+        index = container.index
+        return lambda k: index(indexes[k])
+    if name == "insert":
+        insert = container.insert
+        return lambda k: insert(indexes[k], k)
+    if isinstance(container, deque):
+        # deque.pop() takes no index.
+        def pop(k: int):
+            index = indexes[k]
+            if index == 0:
+                return container.popleft()
+            if index == len(container) - 1:
+                return container.pop()
+            value = container[index]
+            del container[index]
+            return value
+
+        return pop
+    pop = container.pop
+    return lambda k: pop(indexes[k])
+
+
+def measure(cls, name: str, pattern: str, size: int, budget: float) -> dict:
+    """
+    Times operation `name` on `cls` instances of `size` elements for about `budget` seconds
+    and traces the memory of a few more; returns operations per second and peak bytes per operation.
+
+    Building the instances is not timed. Pops run in rounds on fresh instances, each popping
+    at most half of the elements, so small sizes still get enough operations.
+    """
+    whole = OPERATIONS[name] == ["all"]
+    per_round = max(size // 2, 1) if name == "pop" else MAX_OPS
+    spare = 1 if whole else min(MEMORY_OPS, per_round)
+    done = 0
+    elapsed = 0.0
+    while done < MAX_OPS and elapsed < budget:
+        container = cls(range(size))
+        count = min(per_round, MAX_OPS - done)
+        run = operation(name, container, pattern, size, count + spare)
+        k = 0
+        batch = 1
+        start = time.perf_counter()
+        while k < count:
+            end = min(k + batch, count)
+            for i in range(k, end):
+                run(i)
+            k = end
+            if elapsed + time.perf_counter() - start > budget:
+                break
+            batch = min(batch * 2, 1024)
+        elapsed += time.perf_counter() - start
+        done += k
+    traced = min(spare, done)
+    if name == "pop":
+        container = cls(range(size))
+        run = operation(name, container, pattern, size, traced)
+        k = 0
+    tracemalloc.start()
+    for i in range(k, k + traced):
+        run(i)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"ops_per_sec": done / elapsed, "peak_bytes_per_op": peak / traced}
+
+
+def fit(sizes: list, seconds: list) -> str:
+    """
+    Returns the complexity whose curve fits the seconds per operation at `sizes` best,
+    by least squares in log space; `"n/a"` with fewer than three sizes.
+    """
+    if len(sizes) < 3:
+        return "n/a"
+    best, best_error = "n/a", math.inf
+    for label, curve in COMPLEXITIES.items():
+        logs = [math.log(t / curve(n)) for n, t in zip(sizes, seconds)]
+        mean = sum(logs) / len(logs)
+        error = sum((value - mean) ** 2 for value in logs)
+        if error < best_error:
+            best, best_error = label, error
+    return best
+
+
+def run_suite(
+    classes: list, operations: list, patterns: list, sizes: list, budget: float
+) -> list:
+    """
+    Returns a result record for every class, operation, pattern and size.
+    """
+    results = []
+    for name in operations:
+        for class_name in classes:
+            for pattern in OPERATIONS[name]:
+                if pattern != "all" and pattern not in patterns:
+                    continue
+                for size in sizes:
+                    record = measure(CLASSES[class_name], name, pattern, size, budget)
+                    record.update(
+                        {
+                            "class": class_name,
+                            "operation": name,
+                            "pattern": pattern,
+                            "size": size,
+                        }
+                    )
+                    results.append(record)
+    return results
+
+
+def complexities(results: list) -> dict:
+    """
+    Returns the fitted complexity of every class, operation and pattern, keyed `class/operation/pattern`.
+    """
+    series = {}
+    for record in results:
+        key = f"{record['class']}/{record['operation']}/{record['pattern']}"
+        series.setdefault(key, []).append((record["size"], 1 / record["ops_per_sec"]))
+    return {
+        key: fit([n for n, _ in points], [t for _, t in points])
+        for key, points in series.items()
+    }
+
+
+def report(results: list, fitted: dict, sizes: list) -> None:
+    for name in dict.fromkeys(record["operation"] for record in results):
+        print(f"\n{name} (operations per second)")
+        print(
+            f"{'class':<10}{'pattern':<12}"
+            + "".join(f"{size:>12,}" for size in sizes)
+            + f"{'peak B/op':>12}{'fit':>12}"
+        )
+        rows = {}
+        for record in results:
+            if record["operation"] == name:
+                rows.setdefault((record["class"], record["pattern"]), {})[
+                    record["size"]
+                ] = record
+        for (class_name, pattern), by_size in rows.items():
+            largest = by_size[max(by_size)]
+            print(
+                f"{class_name:<10}{pattern:<12}"
+                + "".join(f"{by_size[size]['ops_per_sec']:>12,.0f}" for size in sizes)
+                + f"{largest['peak_bytes_per_op']:>12,.0f}"
+                + f"{fitted[f'{class_name}/{name}/{pattern}']:>12}"
+            )
+
+
+def regressions(results: list, baseline: dict, threshold: float) -> list:
+    """
+    Returns `(record, baseline ops per second)` for every result slower than its baseline
+    counterpart by more than the fraction `threshold`.
+    """
+    previous = {
+        (r["class"], r["operation"], r["pattern"], r["size"]): r["ops_per_sec"]
+        for r in baseline["results"]
+    }
+    slower = []
+    for record in results:
+        key = (record["class"], record["operation"], record["pattern"], record["size"])
+        if key in previous and record["ops_per_sec"] < previous[key] * (1 - threshold):
+            slower.append((record, previous[key]))
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument("sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument(
+        "--classes", nargs="+", choices=list(CLASSES), default=DEFAULT_CLASSES
+    )
+    parser.add_argument(
+        "--operations", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS)
+    )
+    parser.add_argument("--patterns", nargs="+", choices=PATTERNS, default=PATTERNS)
+    parser.add_argument(
+        "--budget", type=float, default=0.05, help="seconds timed per measurement"
+    )
+    parser.add_argument(
+        "--save", metavar="FILE", help="write the results as a JSON baseline"
+    )
+    parser.add_argument(
+        "--compare", metavar="FILE", help="flag regressions against a JSON baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fraction of the baseline's operations per second that counts as a regression",
+    )
+    args = parser.parse_args()
+    sizes = sorted(args.sizes)
+    results = []
+    fitted = {}
+    # One operation at a time, so each table is printed as soon as it is measured.
+    for name in args.operations:
+        measured = run_suite(args.classes, [name], args.patterns, sizes, args.budget)
+        fitted.update(complexities(measured))
+        report(measured, fitted, sizes)
+        sys.stdout.flush()
+        results.extend(measured)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(
+                {
+                    "meta": {
+                        "created": datetime.datetime.now().isoformat(
+                            timespec="seconds"
+                        ),
+                        "python": sys.version.split()[0],
+                        "platform": platform.platform(),
+                        "budget": args.budget,
+                    },
+                    "results": results,
+                    "complexity": fitted,
+                },
+                file,
+                indent=1,
+            )
+        print(f"\nsaved baseline to {args.save}")
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        slower = regressions(results, baseline, args.threshold)
+        print(
+            f"\n{len(slower)} regression(s) beyond {args.threshold:.0%} against {args.compare}"
+        )
+        for record, before in slower:
+            print(
+                f"  {record['class']} {record['operation']} {record['pattern']} n={record['size']:,}:"
+                f" {before:,.0f} -> {record['ops_per_sec']:,.0f} ops/s"
+            )
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Fixed-capacity LRU and LFU caches with O(1) hits and evictions.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Fixed-capacity LRU and LFU caches with O(1) hits and evictions.
+"""
+
+# Generic/Built-in
+from collections import namedtuple
+from typing import Callable, Hashable, Iterator, Union
+
+# Owned
+from linkedlist import DoublyLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+CacheStats = namedtuple(
+    "CacheStats", ["hits", "misses", "evictions", "capacity", "size"]
+)
+
+POLICIES = ("lru", "lfu")
+
+_MISSING = object()
+
+
+class LinkedCache:
+    """
+    Mapping of at most `capacity` keys that evicts by a least recently used (`"lru"`) or
+    least frequently used (`"lfu"`) policy.
+
+    Each key maps to its node in a `DoublyLinkedList` of keys ordered from the next to be
+    evicted to the last, so a hit relinks the node instead of searching for the key. LRU keeps
+    one such list. LFU keeps one per use count, each in LRU order, plus the lowest count in use,
+    so ties are broken by recency. Lookups, insertions and evictions are all O(1).
+
+    `on_evict(key, value)` is called for every key evicted to make room; `stats()` reports
+    hits, misses and evictions.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        policy: str = "lru",
+        on_evict: Union[Callable[[Hashable, object], None], None] = None,
+    ) -> None:
+        if not isinstance(capacity, int):
+            raise TypeError(
+                f"'{type(capacity).__name__}' object cannot be interpreted as an integer"
+            )
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, not {policy!r}")
+        self.__capacity: int = capacity
+        self.__policy: str = policy
+        self.__on_evict = on_evict
+        self.__values: dict = {}
+        self.__nodes: dict = {}
+        self.__order = DoublyLinkedList()
+        self.__counts: dict = {}
+        self.__buckets: dict = {}
+        self.__min_count: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def policy(self) -> str:
+        return self.__policy
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __contains__(self, key) -> bool:
+        """
+        Tests for `key` without counting a hit or a miss or changing its eviction order.
+        """
+        return key in self.__values
+
+    def __iter__(self) -> Iterator:
+        """
+        Iterates over the keys from the next to be evicted to the last.
+        """
+        if self.__policy == "lru":
+            return iter(list(self.__order))
+        return iter(
+            [key for count in sorted(self.__buckets) for key in self.__buckets[count]]
+        )
+
+    def __str__(self) -> str:
+        return str({key: self.__values[key] for key in self})
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __touch(self, key) -> None:
+        """
+        Records a use of a cached `key`.
+        """
+        node = self.__nodes[key]
+        if self.__policy == "lru":
+            self.__order._move_node_to_end(node)
+            return
+        count = self.__counts[key]
+        bucket = self.__buckets[count]
+        bucket._unlink_node(node)
+        if not bucket:
+            del self.__buckets[count]
+            if self.__min_count == count:
+                self.__min_count = count + 1
+        self.__counts[key] = count + 1
+        self.__link(key)
+
+    def __link(self, key) -> None:
+        """
+        Adds the node of `key` as the most recent one in its list.
+        """
+        if self.__policy == "lru":
+            self.__nodes[key] = self.__order._append_node(key)
+            return
+        count = self.__counts[key]
+        bucket = self.__buckets.get(count)
+        if bucket is None:
+            bucket = self.__buckets[count] = DoublyLinkedList()
+        self.__nodes[key] = bucket._append_node(key)
+
+    def __evict(self) -> None:
+        if self.__policy == "lru":
+            key = self.__order.popleft()
+        else:
+            bucket = self.__buckets[self.__min_count]
+            key = bucket.popleft()
+            if not bucket:
+                del self.__buckets[self.__min_count]
+            del self.__counts[key]
+        del self.__nodes[key]
+        value = self.__values.pop(key)
+        self.__evictions += 1
+        if self.__on_evict is not None:
+            self.__on_evict(key, value)
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for `key` and records a use of it, or `default` if absent.
+        """
+        value = self.__values.get(key, _MISSING)
+        if value is _MISSING:
+            self.__misses += 1
+            return default
+        self.__hits += 1
+        self.__touch(key)
+        return value
+
+    def peek(self, key, default=None):
+        """
+        Returns the value cached for `key`, or `default`, without recording a use.
+        """
+        return self.__values.get(key, default)
+
+    def put(self, key, value) -> None:
+        """
+        Caches `value` for `key`, counting as a use of `key`.
+
+        Evicts one key first when the cache is full and `key` is new.
+        """
+        if key in self.__values:
+            self.__values[key] = value
+            self.__touch(key)
+            return
+        if len(self.__values) >= self.__capacity:
+            self.__evict()
+        self.__values[key] = value
+        if self.__policy == "lfu":
+            self.__counts[key] = 1
+            self.__min_count = 1
+        self.__link(key)
+
+    def pop(self, key, default=_MISSING):
+        """
+        Removes `key` and returns its value, without calling `on_evict`.
+
+        Returns `default` if `key` is absent, or raises `KeyError` if no `default` is given.
+        """
+        value = self.__values.pop(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        node = self.__nodes.pop(key)
+        if self.__policy == "lru":
+            self.__order._unlink_node(node)
+            return value
+        count = self.__counts.pop(key)
+        bucket = self.__buckets[count]
+        bucket._unlink_node(node)
+        if not bucket:
+            # A stale lowest count is harmless: the cache is no longer full, so the next
+            # eviction comes after inserting a new key, which resets it to 1.
+            del self.__buckets[count]
+        return value
+
+    def clear(self) -> None:
+        """
+        Removes every key without calling `on_evict`; the statistics are kept.
+        """
+        self.__values.clear()
+        self.__nodes.clear()
+        self.__order.clear()
+        self.__counts.clear()
+        self.__buckets.clear()
+        self.__min_count = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hits, misses and evictions so far with the capacity and current size.
+        """
+        return CacheStats(
+            self.__hits,
+            self.__misses,
+            self.__evictions,
+            self.__capacity,
+            len(self.__values),
+        )
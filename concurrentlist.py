@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Thread-safe FIFO linked list with separate head and tail locks.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Thread-safe FIFO linked list with separate head and tail locks.
+"""
+
+# Generic/Built-in
+import threading
+import time
+from typing import Iterable, Iterator, Union
+
+# Owned
+from node import SinglyNode
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+
+class ConcurrentLinkedList:
+    """
+    Thread-safe singly linked list used as a FIFO queue between threads.
+
+    Producers `append()` at the tail under a tail lock and consumers `popleft()` at the head
+    under a separate head lock, so the two ends don't contend (the two-lock queue of Michael
+    and Scott). The head is a dummy node, which keeps the ends disjoint even when the linked
+    list is empty. A consumer that finds the linked list empty waits on a condition of the
+    tail lock, which producers only signal when someone is waiting.
+    """
+
+    def __init__(self, x: Iterable = None) -> None:
+        self.__head = SinglyNode(None)
+        self.__tail = self.__head
+        self.__head_lock = threading.Lock()
+        self.__tail_lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__tail_lock)
+        self.__waiting: int = 0
+        self.__appended: int = 0
+        self.__popped: int = 0
+        if x is not None:
+            self.extend(x)
+
+    @property
+    def shape(self) -> tuple:
+        return tuple([len(self)])
+
+    def __len__(self) -> int:
+        # Read the consumer count first: elements are counted in before they can be counted out.
+        popped = self.__popped
+        return self.__appended - popped
+
+    def __contains__(self, x) -> bool:
+        return x in list(self)
+
+    def __iter__(self) -> Iterator:
+        """
+        Iterates over a snapshot of the linked list taken while holding both locks.
+        """
+        with self.__head_lock, self.__tail_lock:
+            values = []
+            current = self.__head.next
+            while current:
+                values.append(current.value)
+                current = current.next
+        return iter(values)
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the linked list.
+
+        Reads two counters without locking, so under concurrent use the result is a moment's
+        snapshot rather than exact.
+        """
+        return len(self)
+
+    def append(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list in O(1), holding only the tail lock.
+        """
+        node = SinglyNode(x)
+        with self.__tail_lock:
+            self.__tail.next = node
+            self.__tail = node
+            self.__appended += 1
+            if self.__waiting:
+                self.__not_empty.notify()
+
+    def extend(self, x: Iterable) -> None:
+        """
+        Adds the elements of an iterable `x` at the end of the linked list.
+
+        The nodes are chained before taking the tail lock, which is then held only to link
+        the whole chain; consumers see the elements all at once.
+        """
+        head = tail = None
+        count = 0
+        for element in x:
+            node = SinglyNode(element)
+            if tail:
+                tail.next = node
+            else:
+                head = node
+            tail = node
+            count += 1
+        if not count:
+            return
+        with self.__tail_lock:
+            self.__tail.next = head
+            self.__tail = tail
+            self.__appended += count
+            if self.__waiting:
+                self.__not_empty.notify(count)
+
+    def popleft(self, block: bool = True, timeout: Union[float, None] = None):
+        """
+        Removes and returns the first element of the linked list, holding only the head lock.
+
+        If `block` is true, waits up to `timeout` seconds (forever if `timeout` is `None`) for
+        an element to arrive; raises `IndexError` if none is available in time.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None
+        while True:
+            with self.__head_lock:
+                node = self.__head.next
+                if node is not None:
+                    self.__head = node
+                    self.__popped += 1
+                    value = node.value
+                    node.value = None
+                    return value
+            if not block:
+                raise IndexError("pop from empty linked list")
+            with self.__not_empty:
+                # Producers link under the tail lock, so an element can't slip in unseen
+                # between this check and the wait.
+                if self.__head.next is not None:
+                    continue
+                if timeout is not None:
+                    if deadline is None:
+                        deadline = time.monotonic() + timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise IndexError("pop from empty linked list")
+                else:
+                    remaining = None
+                self.__waiting += 1
+                try:
+                    self.__not_empty.wait(remaining)
+                finally:
+                    self.__waiting -= 1
+
+    def peekleft(self):
+        """
+        Returns the first element of the linked list without removing it.
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        with self.__head_lock:
+            node = self.__head.next
+            if node is None:
+                raise IndexError("peek from empty linked list")
+            return node.value
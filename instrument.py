@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Opt-in traversal and allocation instrumentation for the singly and doubly linked lists.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Opt-in traversal and allocation instrumentation for the singly and doubly linked lists.
+
+`instrument(ll)` swaps the class of one linked list for an instrumented subclass, so lists
+that aren't instrumented run the original code and pay nothing.
+"""
+
+# Generic/Built-in
+import functools
+import time
+from collections import namedtuple
+from typing import Callable, Union
+
+# Owned
+from linkedlist import DoublyLinkedList, SinglyLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+
+OperationStats = namedtuple(
+    "OperationStats", ["calls", "hops", "allocations", "seconds"]
+)
+
+# Public methods timed as one operation each. A method called from inside another timed
+# method is counted as part of the outer call.
+OPERATIONS = (
+    "get",
+    "index",
+    "count",
+    "insert",
+    "pop",
+    "remove",
+    "append",
+    "appendleft",
+    "popleft",
+    "extend",
+    "extendleft",
+    "get_many",
+    "insert_many",
+    "pop_many",
+    "insert_after",
+    "insert_before",
+    "remove_node",
+    "move_to_end",
+    "__contains__",
+    "__getitem__",
+    "__setitem__",
+    "__delitem__",
+)
+
+
+class Profile:
+    """
+    Calls, node hops, node allocations and seconds, totalled per operation.
+
+    Hops are the `next`/`prev` links followed by positional walks, value searches, counting,
+    and the walks of the batched and slice operations.
+    Allocations are the nodes created, including those that replace a slice.
+    """
+
+    def __init__(self) -> None:
+        self.__totals = {}
+
+    def record(
+        self, operation: str, hops: int, allocations: int, seconds: float
+    ) -> None:
+        totals = self.__totals.get(operation)
+        if totals is None:
+            self.__totals[operation] = [1, hops, allocations, seconds]
+        else:
+            totals[0] += 1
+            totals[1] += hops
+            totals[2] += allocations
+            totals[3] += seconds
+
+    def stats(self) -> dict:
+        """
+        Returns a map from each recorded operation to its `OperationStats`.
+        """
+        return {
+            operation: OperationStats(*totals)
+            for operation, totals in self.__totals.items()
+        }
+
+    def reset(self) -> None:
+        self.__totals.clear()
+
+
+# Totals over every instrumented linked list, and the hooks called after each operation.
+GLOBAL = Profile()
+_hooks = []
+
+
+def add_hook(hook: Callable) -> None:
+    """
+    Calls `hook(ll, operation, hops, allocations, seconds)` after every operation on any
+    instrumented linked list, e.g. to export the numbers to a metrics pipeline.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable) -> None:
+    _hooks.remove(hook)
+
+
+def global_stats() -> dict:
+    """
+    Returns the `OperationStats` of every operation, totalled over all instrumented lists.
+    """
+    return GLOBAL.stats()
+
+
+def stats(ll: Union[SinglyLinkedList, DoublyLinkedList]) -> dict:
+    """
+    Returns the `OperationStats` of every operation on the instrumented linked list `ll`.
+    """
+    return _state(ll).profile.stats()
+
+
+class _State:
+    """
+    Per-list profile and hook, plus the counters of the operation in progress.
+    """
+
+    __slots__ = ("profile", "hook", "depth", "hops", "allocations", "allocating")
+
+    def __init__(self, hook: Union[Callable, None]) -> None:
+        self.profile = Profile()
+        self.hook = hook
+        self.depth = 0
+        self.hops = 0
+        self.allocations = 0
+        self.allocating = False
+
+
+def _state(ll) -> _State:
+    state = getattr(ll, "_instrumentation", None)
+    if state is None:
+        raise ValueError("linked list is not instrumented")
+    return state
+
+
+def _timed(operation: str, method: Callable) -> Callable:
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        state = self._instrumentation
+        if state.depth:
+            state.depth += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                state.depth -= 1
+        state.depth = 1
+        state.hops = 0
+        state.allocations = 0
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            state.depth = 0
+            hops = state.hops
+            allocations = state.allocations
+            state.profile.record(operation, hops, allocations, seconds)
+            GLOBAL.record(operation, hops, allocations, seconds)
+            if state.hook is not None:
+                state.hook(self, operation, hops, allocations, seconds)
+            for hook in _hooks:
+                hook(self, operation, hops, allocations, seconds)
+
+    return timed
+
+
+def _allocating(method: Callable) -> Callable:
+    """
+    Counts the nodes created by `method`, which adds elements without removing any.
+    """
+
+    @functools.wraps(method)
+    def allocating(self, *args, **kwargs):
+        state = self._instrumentation
+        if state.allocating:
+            # Already counted by the method that delegated here, e.g. `insert_before()`.
+            return method(self, *args, **kwargs)
+        state.allocating = True
+        size = len(self)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            state.allocating = False
+            state.allocations += len(self) - size
+
+    return allocating
+
+
+def _singly_hops(ll, prefix: str, index: int) -> int:
+    """
+    Returns how many links `SinglyLinkedList.__node_at(index)` follows from where it starts.
+    """
+    if index == getattr(ll, prefix + "size") - 1:
+        return 0
+    finger_index = getattr(ll, prefix + "finger_index")
+    if getattr(ll, prefix + "finger") is not None and finger_index <= index:
+        return index - finger_index
+    return index
+
+
+def _doubly_hops(ll, prefix: str, index: int) -> int:
+    """
+    Returns how many links `DoublyLinkedList.__node_at(index)` follows from where it starts.
+    """
+    distance = min(index, getattr(ll, prefix + "size") - 1 - index)
+    if getattr(ll, prefix + "finger") is not None:
+        distance = min(distance, abs(index - getattr(ll, prefix + "finger_index")))
+    return distance
+
+
+def _subclass(base: type, hops: Callable) -> type:
+    """
+    Returns a subclass of `base` whose timed operations and walks are counted.
+    """
+    # The walks are private to `base`, so they are overridden under their mangled names.
+    prefix = f"_{base.__name__}__"
+    node_at = getattr(base, prefix + "node_at")
+    walk = getattr(base, prefix + "walk")
+    replace_range = getattr(base, prefix + "replace_range")
+    find = getattr(base, prefix + "find")
+    nodes_of = getattr(base, prefix + "nodes_of")
+    positions_of = getattr(base, prefix + "positions")
+    # Only the doubly linked list counts negative indexes from the end.
+    negative = base is DoublyLinkedList
+
+    def counted_node_at(self, index: int):
+        self._instrumentation.hops += hops(self, prefix, index)
+        return node_at(self, index)
+
+    def counted_walk(self, positions: range):
+        self._instrumentation.hops += (len(positions) - 1) * abs(positions.step)
+        return walk(self, positions)
+
+    # The batched and slice operations walk inline, so their hops are worked out from the
+    # positions they visit: a single pass from the first to the last.
+    def counted_positions(self, indexes, message: str) -> list:
+        positions = positions_of(self, indexes, message)
+        if positions:
+            self._instrumentation.hops += max(positions) - min(positions)
+        return positions
+
+    def counted_replace_range(self, start: int, count: int, values: list) -> None:
+        self._instrumentation.hops += count
+        self._instrumentation.allocations += len(values)
+        replace_range(self, start, count, values)
+
+    def count(self, x) -> int:
+        if nodes_of(self, x) is None:
+            # Without a value index counting scans the whole linked list.
+            self._instrumentation.hops += len(self)
+        return base.count(self, x)
+
+    def insert_many(self, pairs) -> None:
+        pairs = list(pairs)
+        size = len(self)
+        base.insert_many(self, pairs)
+        positions = [
+            min(max(index + size if negative and index < 0 else index, 0), size)
+            for index, _ in pairs
+        ]
+        if positions:
+            self._instrumentation.hops += max(positions) - min(positions)
+
+    def __delitem__(self, key) -> None:
+        positions = range(*key.indices(len(self))) if isinstance(key, slice) else None
+        base.__delitem__(self, key)
+        # Contiguous slices are counted by `__replace_range()`.
+        if positions and positions.step != 1:
+            self._instrumentation.hops += abs(positions[-1] - positions[0])
+
+    def counted_find(self, x) -> tuple:
+        index, node = find(self, x)
+        if node is not None:
+            self._instrumentation.hops += index
+        elif nodes_of(self, x) is None:
+            # Without a value index the search walked the whole linked list.
+            self._instrumentation.hops += len(self)
+        return index, node
+
+    def __init__(self, *args, **kwargs) -> None:
+        # Linked lists built by an instrumented one, e.g. by `split_at()`, are instrumented too.
+        self._instrumentation = _State(None)
+        base.__init__(self, *args, **kwargs)
+
+    def __reduce__(self) -> tuple:
+        return (base,) + base.__reduce__(self)[1:]
+
+    namespace = {
+        prefix + "node_at": counted_node_at,
+        prefix + "walk": counted_walk,
+        prefix + "positions": counted_positions,
+        prefix + "replace_range": counted_replace_range,
+        prefix + "find": counted_find,
+        "__init__": __init__,
+        "__reduce__": __reduce__,
+    }
+    counted = {"count": count, "insert_many": insert_many, "__delitem__": __delitem__}
+    # Nodes are only created by these and by `__replace_range()`; `extend()` and
+    # `extendleft()` go through `append()` and `appendleft()`.
+    allocating = (
+        "append",
+        "appendleft",
+        "insert",
+        "insert_after",
+        "insert_before",
+        "insert_many",
+    )
+    for operation in OPERATIONS:
+        method = counted.get(operation) or getattr(base, operation, None)
+        if method is not None:
+            if operation in allocating:
+                method = _allocating(method)
+            namespace[operation] = _timed(operation, method)
+    return type(f"Instrumented{base.__name__}", (base,), namespace)
+
+
+_SUBCLASSES = {
+    SinglyLinkedList: _subclass(SinglyLinkedList, _singly_hops),
+    DoublyLinkedList: _subclass(DoublyLinkedList, _doubly_hops),
+}
+
+
+def instrument(
+    ll: Union[SinglyLinkedList, DoublyLinkedList], hook: Callable = None
+) -> Profile:
+    """
+    Starts counting the operations on `ll` and returns its `Profile`.
+
+    `hook(ll, operation, hops, allocations, seconds)`, if given, is called after every
+    operation on `ll`, in addition to the hooks added with `add_hook()`.
+    """
+    if getattr(ll, "_instrumentation", None) is not None:
+        ll._instrumentation.hook = hook
+        return ll._instrumentation.profile
+    subclass = _SUBCLASSES.get(type(ll))
+    if subclass is None:
+        raise TypeError(
+            f"can't instrument '{type(ll).__name__}', only SinglyLinkedList and DoublyLinkedList"
+        )
+    ll._instrumentation = _State(hook)
+    ll.__class__ = subclass
+    return ll._instrumentation.profile
+
+
+def uninstrument(ll: Union[SinglyLinkedList, DoublyLinkedList]) -> None:
+    """
+    Stops counting the operations on `ll`, restoring its original class.
+    """
+    _state(ll)
+    ll.__class__ = next(
+        base for base, subclass in _SUBCLASSES.items() if type(ll) is subclass
+    )
+    del ll._instrumentation
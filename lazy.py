@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Lazy, chainable pipelines over linked lists.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Lazy, chainable pipelines over linked lists.
+"""
+
+# Generic/Built-in
+import itertools
+from typing import Callable, Iterable, Iterator
+
+# Owned
+from linkedlist import DoublyLinkedList, SinglyLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+_MISSING = object()
+
+
+def _check_count(n: int) -> None:
+    if not isinstance(n, int):
+        raise TypeError(
+            f"'{type(n).__name__}' object cannot be interpreted as an integer"
+        )
+    if n < 0:
+        raise ValueError("n must be non-negative")
+
+
+class LazyPipeline:
+    """
+    Chain of transformations over an iterable, usually a linked list, evaluated on demand.
+
+    Stages such as `map()` and `filter()` return a new pipeline without touching any
+    element. A terminal operation such as `to_singly()` or `reduce()` then pulls the elements
+    through all stages with generators, walking the source once with O(1) extra memory per
+    stage; `take()` and `take_while()` stop the walk early. A pipeline can be run again,
+    each run iterating its source afresh.
+    """
+
+    def __init__(self, source: Iterable, stages: tuple = ()) -> None:
+        if not isinstance(source, Iterable):
+            raise TypeError(f"'{type(source).__name__}' object is an invalid type")
+        self.__source = source
+        # Callables from an iterator to an iterator, applied in order.
+        self.__stages = stages
+
+    def __iter__(self) -> Iterator:
+        iterator = iter(self.__source)
+        for stage in self.__stages:
+            iterator = stage(iterator)
+        return iterator
+
+    def __then(self, stage: Callable[[Iterator], Iterator]) -> "LazyPipeline":
+        return LazyPipeline(self.__source, self.__stages + (stage,))
+
+    def map(self, func: Callable) -> "LazyPipeline":
+        """
+        Applies `func` to every element.
+        """
+        return self.__then(lambda iterator: map(func, iterator))
+
+    def filter(self, predicate: Callable) -> "LazyPipeline":
+        """
+        Keeps the elements for which `predicate` is true.
+        """
+        return self.__then(lambda iterator: filter(predicate, iterator))
+
+    def take(self, n: int) -> "LazyPipeline":
+        """
+        Keeps the first `n` elements and stops pulling from the source after them.
+        """
+        _check_count(n)
+        return self.__then(lambda iterator: itertools.islice(iterator, n))
+
+    def skip(self, n: int) -> "LazyPipeline":
+        """
+        Drops the first `n` elements.
+        """
+        _check_count(n)
+        return self.__then(lambda iterator: itertools.islice(iterator, n, None))
+
+    def take_while(self, predicate: Callable) -> "LazyPipeline":
+        """
+        Keeps elements while `predicate` is true and stops at the first for which it is false.
+        """
+        return self.__then(lambda iterator: itertools.takewhile(predicate, iterator))
+
+    def drop_while(self, predicate: Callable) -> "LazyPipeline":
+        """
+        Drops elements while `predicate` is true, then keeps the rest.
+        """
+        return self.__then(lambda iterator: itertools.dropwhile(predicate, iterator))
+
+    def chain(self, *others: Iterable) -> "LazyPipeline":
+        """
+        Follows the elements with those of each iterable in `others`, such as other linked lists.
+        """
+        for other in others:
+            if not isinstance(other, Iterable):
+                raise TypeError(f"'{type(other).__name__}' object is an invalid type")
+        return self.__then(lambda iterator: itertools.chain(iterator, *others))
+
+    def to_singly(self, indexed: bool = False) -> SinglyLinkedList:
+        """
+        Returns the elements as a new `SinglyLinkedList`.
+        """
+        return SinglyLinkedList(iter(self), indexed)
+
+    def to_doubly(self, indexed: bool = False) -> DoublyLinkedList:
+        """
+        Returns the elements as a new `DoublyLinkedList`.
+        """
+        return DoublyLinkedList(iter(self), indexed)
+
+    def to_list(self) -> list:
+        """
+        Returns the elements as a new list.
+        """
+        return list(self)
+
+    def reduce(self, func: Callable, initial=_MISSING):
+        """
+        Combines the elements from left to right with `func`, starting from `initial` if given;
+        behaves exactly as `functools.reduce()`.
+        """
+        iterator = iter(self)
+        value = next(iterator, _MISSING) if initial is _MISSING else initial
+        if value is _MISSING:
+            raise TypeError("reduce() of empty iterable with no initial value")
+        for element in iterator:
+            value = func(value, element)
+        return value
+
+    def count(self) -> int:
+        """
+        Returns the number of elements.
+        """
+        return sum(1 for _ in self)
+
+    def first(self, default=_MISSING):
+        """
+        Returns the first element, pulling nothing further from the source.
+
+        Returns `default` if there are no elements, or raises `IndexError` if no `default` is given.
+        """
+        value = next(iter(self), default)
+        if value is _MISSING:
+            raise IndexError("first from empty pipeline")
+        return value
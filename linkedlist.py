@@ -41,10 +41,12 @@ Simple pythonic implementations of singly and doubly linked lists.
 """
 
 # Generic/Built-in
-from typing import Iterable, Union
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Union
 
 # Owned
-from node import Node
+import serialization
+from node import Node, SinglyNode
 
 __author__ = "Shatanik Mukherjee"
 __copyright__ = "Copyright (c) 2024"
@@ -55,47 +57,458 @@ __maintainer__ = "Shatanik Mukherjee"
 __email__ = "shatanikmukherjee171@gmail.com"
 __status__ = "Dev"
 
+# Number of leading elements shown by `str()` and `repr()` of a longer linked list.
+REPR_LIMIT = 100
+
+
+def _cut(node, count: int):
+    """
+    Detaches the chain starting at `node` after `count` nodes and returns the rest.
+    """
+    for _ in range(count - 1):
+        if not node:
+            return None
+        node = node.next
+    if not node:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge(left, right, key: Union[Callable, None], reverse: bool) -> tuple:
+    """
+    Stably merges two sorted chains of nodes linked by `next`.
+
+    Returns the head and tail of the merged chain and the exception raised by `key` or a
+    comparison, if any; on error the unmerged nodes are appended so that none is lost.
+    """
+    head = tail = None
+    error = None
+    try:
+        if left and right:
+            left_key = left.value if key is None else key(left.value)
+            right_key = right.value if key is None else key(right.value)
+        while left and right:
+            taken_right = left_key < right_key if reverse else right_key < left_key
+            if taken_right:
+                node = right
+                right = node.next
+            else:
+                node = left
+                left = node.next
+            # Link the node before computing the next key, so a raising `key` can't lose it.
+            if tail:
+                tail.next = node
+            else:
+                head = node
+            tail = node
+            if taken_right:
+                if right:
+                    right_key = right.value if key is None else key(right.value)
+            elif left:
+                left_key = left.value if key is None else key(left.value)
+    except Exception as exc:
+        error = exc
+    for rest in (left, right):
+        if rest:
+            if tail:
+                tail.next = rest
+            else:
+                head = rest
+            while rest.next:
+                rest = rest.next
+            tail = rest
+    return head, tail, error
+
+
+def _merge_sort(head, size: int, key: Union[Callable, None], reverse: bool) -> tuple:
+    """
+    Stable bottom-up merge sort of a chain of `size >= 2` nodes linked by `next`.
+
+    Returns the new head and tail and the exception that stopped the sort, if any;
+    the chain always keeps every node.
+    """
+    width = 1
+    while width < size:
+        merged_head = merged_tail = None
+        current = head
+        while current:
+            left = current
+            right = _cut(left, width)
+            current = _cut(right, width)
+            chunk_head, chunk_tail, error = _merge(left, right, key, reverse)
+            if merged_tail:
+                merged_tail.next = chunk_head
+            else:
+                merged_head = chunk_head
+            merged_tail = chunk_tail
+            if error is not None:
+                merged_tail.next = current
+                while merged_tail.next:
+                    merged_tail = merged_tail.next
+                return merged_head, merged_tail, error
+        head, tail = merged_head, merged_tail
+        width *= 2
+    return head, tail, None
+
+
+def _preview(values: Iterable, size: int) -> str:
+    """
+    Returns `values` formatted like a `list`, truncated after `REPR_LIMIT` elements.
+    """
+    if size <= REPR_LIMIT:
+        return str(list(values))
+    shown = ", ".join(repr(value) for value in islice(values, REPR_LIMIT))
+    return f"[{shown}, ... ({size - REPR_LIMIT} more)]"
+
+
+class NodeHandle:
+    """
+    Opaque reference to an element of a `SinglyLinkedList` or `DoublyLinkedList`.
+
+    Returned by `append(x, handle=True)`, `insert(index, x, handle=True)` and `insert_after()`
+    or `insert_before()`, and accepted by the methods that act on an element in O(1). It stays
+    valid until the element is removed or its linked list is cleared, split, spliced or merged
+    into another; using it afterwards raises `ValueError`.
+    """
+
+    __slots__ = ("_node", "_owner", "_epoch")
+
+    def __init__(self, node, owner, epoch: int) -> None:
+        self._node = node
+        self._owner = owner
+        self._epoch = epoch
+
+    @property
+    def value(self):
+        return self._node.value
+
 
 class SinglyLinkedList:
     """
     Simple implementation of a singly linked list.
 
     Doesn't support negative indexing.
+
+    With `indexed=True` it keeps a map from each hashable value to its nodes, so
+    membership tests, `count()` and rejecting a missing value are O(1).
+
+    With `stack=True` the beginning of the linked list is the top of a stack: `append()`
+    and `extend()` add at the beginning and `pop()` and `peek()` act on the first element,
+    all in O(1), so indexes and iteration start from the most recently appended element.
     """
 
     def __init__(
-        self, x: Union["SinglyLinkedList", "DoublyLinkedList", Iterable] = None
+        self,
+        x: Union["SinglyLinkedList", "DoublyLinkedList", Iterable] = None,
+        indexed: bool = False,
+        stack: bool = False,
     ) -> None:
         self.__size: int = 0
         self.shape: tuple = tuple([self.__size])
         self.__head = None
         self.__tail = None
+        # Last node reached by a positional walk and its index.
+        self.__finger = None
+        self.__finger_index: int = 0
+        # Optional value -> {node: None} map.
+        self.__lookup = {} if indexed else None
+        # Bumped whenever nodes leave in bulk, which invalidates every handle at once.
+        self.__epoch: int = 0
+        # Keeps the live end at the head, where a singly linked list can remove in O(1).
+        self.__stack: bool = stack
         if x:
-            if (
-                not isinstance(x, SinglyLinkedList)
-                and not isinstance(x, DoublyLinkedList)
-                and not isinstance(x, Iterable)
-            ):
-                raise TypeError(f"'{type(x).__name__}' object is an invalid type")
-            if isinstance(x, SinglyLinkedList) or isinstance(x, DoublyLinkedList):
-                for i in range(len(x)):
-                    self.append(x.get(i))
-            else:
-                for element in x:
-                    self.append(element)
+            self.extend(x)
 
     def __len__(self) -> int:
         return self.__size
 
+    def __contains__(self, x) -> bool:
+        nodes = self.__nodes_of(x)
+        if nodes is not None:
+            return bool(nodes)
+        return self.__find(x)[1] is not None
+
+    def __iter__(self) -> Iterator:
+        current = self.__head
+        while current:
+            following = current.next
+            if following is current:
+                raise RuntimeError("linked list changed during iteration")
+            yield current.value
+            current = following
+
+    def __reversed__(self) -> Iterator:
+        # Nodes only link forwards, so the values are buffered once.
+        return reversed(list(self))
+
     def __str__(self) -> str:
-        if not self.__head:
-            return str([])
-        _list = []
+        return _preview(self, self.__size)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({_preview(self, self.__size)})"
+
+    def __reduce__(self) -> tuple:
+        # Pickle the values as one flat list rather than recursing through the nodes.
+        values = list(self)
+        if self.__stack:
+            values.reverse()
+        return type(self), (values, self.__lookup is not None, self.__stack)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            positions = self.__slice_range(key)
+            result = type(self)(indexed=self.__lookup is not None)
+            if positions:
+                result.extend(node.value for node in self.__walk(positions))
+            return result
+        return self.get(key)
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, slice):
+            positions = self.__slice_range(key)
+            values = list(value)
+            if positions.step == 1:
+                self.__replace_range(positions.start, len(positions), values)
+                return
+            if len(values) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} to extended slice of size {len(positions)}"
+                )
+            if positions:
+                for node, element in zip(self.__walk(positions), values):
+                    self.__replace(node, element)
+            return
+        if not isinstance(key, int):
+            raise TypeError(
+                f"'{type(key).__name__}' object cannot be interpreted as an integer"
+            )
+        if key < 0 or key >= self.__size:
+            raise IndexError("linked list assignment index out of range")
+        self.__replace(self.__node_at(key), value)
+
+    def __delitem__(self, key) -> None:
+        if isinstance(key, slice):
+            positions = self.__slice_range(key)
+            if not positions:
+                return
+            if positions.step == 1:
+                self.__replace_range(positions.start, len(positions), [])
+                return
+            start = positions.start
+            previous = self.__node_at(start - 1) if start > 0 else None
+            current = previous.next if previous else self.__head
+            index = start
+            for target in positions:
+                while index < target:
+                    previous = current
+                    current = current.next
+                    index += 1
+                following = current.next
+                if previous:
+                    previous.next = following
+                else:
+                    self.__head = following
+                if current is self.__tail:
+                    self.__tail = previous
+                if self.__lookup is not None:
+                    self.__untrack(current)
+                current.next = current
+                current = following
+                index += 1
+            self.__size -= len(positions)
+            self.shape = tuple([self.__size])
+            self.__finger = None
+            return
+        if not isinstance(key, int):
+            raise TypeError(
+                f"'{type(key).__name__}' object cannot be interpreted as an integer"
+            )
+        if key < 0 or key >= self.__size:
+            raise IndexError("linked list assignment index out of range")
+        self.pop(key)
+
+    def __node_at(self, index: int):
+        """
+        Returns the node at an in-range, non-negative `index`.
+
+        Walks forwards from the finger when it is at or before `index`, otherwise from the head.
+        """
+        if index == self.__size - 1:
+            current = self.__tail
+        else:
+            if self.__finger is not None and self.__finger_index <= index:
+                current = self.__finger
+                count = self.__finger_index
+            else:
+                current = self.__head
+                count = 0
+            while count < index:
+                current = current.next
+                count += 1
+        self.__finger = current
+        self.__finger_index = index
+        return current
+
+    def __track(self, node) -> None:
+        try:
+            self.__lookup.setdefault(node.value, {})[node] = None
+        except TypeError:
+            pass
+
+    def __untrack(self, node) -> None:
+        try:
+            nodes = self.__lookup[node.value]
+        except TypeError:
+            return
+        del nodes[node]
+        if not nodes:
+            del self.__lookup[node.value]
+
+    def __nodes_of(self, x):
+        """
+        Returns the indexed nodes holding `x`, or `None` when there is no value index
+        or `x` is unhashable.
+        """
+        if self.__lookup is None:
+            return None
+        try:
+            return self.__lookup.get(x, {})
+        except TypeError:
+            return None
+
+    def __find(self, x) -> tuple:
+        """
+        Returns the index of the first node holding `x` and the node, or `(-1, None)`.
+
+        Leaves the finger on the preceding node.
+        """
+        nodes = self.__nodes_of(x)
+        if nodes is not None and not nodes:
+            return -1, None
+        index = 0
+        previous = None
         current = self.__head
         while current:
-            _list.append(current.value)
+            if current in nodes if nodes is not None else x == current.value:
+                if previous is not None:
+                    self.__finger = previous
+                    self.__finger_index = index - 1
+                return index, current
+            previous = current
             current = current.next
-        return str(_list)
+            index += 1
+        return -1, None
+
+    def __slice_range(self, key: slice) -> range:
+        """
+        Returns the ascending positions selected by the slice `key`.
+
+        Raises `IndexError` for negative bounds or steps, which a singly linked list can't walk.
+        """
+        if (
+            (key.start is not None and key.start < 0)
+            or (key.stop is not None and key.stop < 0)
+            or (key.step is not None and key.step < 0)
+        ):
+            raise IndexError(
+                "singly linked list slices don't support negative bounds or steps"
+            )
+        return range(*key.indices(self.__size))
+
+    def __walk(self, positions: range) -> Iterator:
+        """
+        Yields the nodes at non-empty, ascending `positions` in a single forward walk.
+
+        Leaves the finger on the last yielded node.
+        """
+        current = self.__node_at(positions[0])
+        yield current
+        for _ in range(len(positions) - 1):
+            for _ in range(positions.step):
+                current = current.next
+            yield current
+        self.__finger = current
+        self.__finger_index = positions[-1]
+
+    def __replace(self, node, x) -> None:
+        if self.__lookup is not None:
+            self.__untrack(node)
+            node.value = x
+            self.__track(node)
+        else:
+            node.value = x
+
+    def __replace_range(self, start: int, count: int, values: list) -> None:
+        """
+        Replaces the `count` nodes from `start` with a new chain holding `values`.
+
+        Leaves the finger on the node before `start`.
+        """
+        previous = self.__node_at(start - 1) if start > 0 else None
+        current = previous.next if previous else self.__head
+        for _ in range(count):
+            if self.__lookup is not None:
+                self.__untrack(current)
+            following = current.next
+            current.next = current
+            current = following
+        head = tail = None
+        for element in values:
+            node = SinglyNode(element)
+            if self.__lookup is not None:
+                self.__track(node)
+            if tail:
+                tail.next = node
+            else:
+                head = node
+            tail = node
+        if tail:
+            tail.next = current
+        if previous:
+            previous.next = head or current
+        else:
+            self.__head = head or current
+            self.__finger = None
+        if not current:
+            self.__tail = tail or previous
+        self.__size += len(values) - count
+        self.shape = tuple([self.__size])
+
+    def __positions(self, indexes: Iterable[int], message: str) -> list:
+        """
+        Returns `indexes` as a list, raising `IndexError` with `message` if any is out of range.
+        """
+        positions = list(indexes)
+        for index in positions:
+            if not isinstance(index, int):
+                raise TypeError(
+                    f"'{type(index).__name__}' object cannot be interpreted as an integer"
+                )
+            if index < 0 or index >= self.__size:
+                raise IndexError(message)
+        return positions
+
+    def __node_of(self, handle: NodeHandle):
+        """
+        Returns the node of a `handle` to an element of this linked list.
+
+        Raises `ValueError` if the element has been removed or the handle belongs elsewhere;
+        removed nodes link to themselves, which is how they are told apart.
+        """
+        if not isinstance(handle, NodeHandle):
+            raise TypeError(f"'{type(handle).__name__}' object is not a node handle")
+        node = handle._node
+        if (
+            handle._owner is not self
+            or handle._epoch != self.__epoch
+            or node.next is node
+        ):
+            raise ValueError(
+                "node handle does not refer to an element of the linked list"
+            )
+        return node
 
     def size(self) -> int:
         """
@@ -108,6 +521,8 @@ class SinglyLinkedList:
         Returns the element at a given `index` of the linked list.
 
         Doesn't support negative indexing; raises `IndexError` if `index` is out of range.
+
+        Walks from the last visited position when possible, so sequential access is amortized O(1).
         """
         if not isinstance(index, int):
             raise TypeError(
@@ -115,39 +530,53 @@ class SinglyLinkedList:
             )
         if index < 0 or index >= self.__size:
             raise IndexError("linked list index out of range")
-        count = 0
-        current = self.__head
-        while current:
-            if count == index:
-                break
-            current = current.next
-            count += 1
-        return current.value
+        return self.__node_at(index).value
 
     def index(self, x) -> int:
         """
         Returns the index of the first occurrence of an element `x` in the linked list.
 
-        Raises `ValueError` if `x` is not present.
+        Raises `ValueError` if `x` is not present; with a value index that check is O(1).
         """
-        index = 0
-        current = self.__head
-        while current:
-            if x == current.value:
-                break
-            current = current.next
-            index += 1
-        if not self.__head or index == self.__size:
+        index, node = self.__find(x)
+        if node is None:
             raise ValueError(
                 f"{repr(x) if isinstance(x, str) else x} is not in the linked list"
             )
         return index
 
-    def append(self, x) -> None:
+    def count(self, x) -> int:
         """
-        Adds an element `x` at the end of the linked list.
+        Returns the number of occurrences of an element `x` in the linked list.
+
+        O(1) with a value index when `x` is hashable.
         """
-        node = Node(x)
+        nodes = self.__nodes_of(x)
+        if nodes is not None:
+            return len(nodes)
+        return sum(1 for value in self if x == value)
+
+    def append(self, x, handle: bool = False) -> Union[NodeHandle, None]:
+        """
+        Adds an element `x` at the end of the linked list, or at the beginning in stack mode.
+
+        Returns a `NodeHandle` to the new element if `handle` is true.
+        """
+        if self.__stack:
+            self.appendleft(x)
+            node = self.__head
+        else:
+            node = self.__append_node(x)
+        if handle:
+            return NodeHandle(node, self, self.__epoch)
+
+    def __append_node(self, x) -> SinglyNode:
+        """
+        Adds an element `x` at the end of the linked list and returns its node.
+        """
+        node = SinglyNode(x)
+        if self.__lookup is not None:
+            self.__track(node)
         if not self.__head:
             self.__head = node
             self.__tail = node
@@ -158,52 +587,68 @@ class SinglyLinkedList:
             self.__tail = node
             self.__size += 1
             self.shape = tuple([self.__size])
+        return node
 
-    def insert(self, index: int, x) -> None:
+    def insert(self, index: int, x, handle: bool = False) -> Union[NodeHandle, None]:
         """
         Adds an element `x` at a given `index` of the linked list.
 
         Doesn't support negative indexing; when `index <= 0` then `x` is added at the beginning;
 
         `x` is added at the end if `index >= SinglyLinkedList.size()`.
+
+        Returns a `NodeHandle` to the new element if `handle` is true.
         """
         if not isinstance(index, int):
             raise TypeError(
                 f"'{type(index).__name__}' object cannot be interpreted as an integer"
             )
         if index <= 0:
-            node = Node(x)
-            if not self.__head:
-                self.__head = node
-                self.__tail = node
-                self.__size = 1
-                self.shape = tuple([self.__size])
-            else:
-                node.next = self.__head
-                self.__head = node
-                self.__size += 1
-                self.shape = tuple([self.__size])
+            self.appendleft(x)
+            node = self.__head
         elif index >= self.__size:
-            self.append(x)
+            node = self.__append_node(x)
         else:
-            node = Node(x)
-            count = 0
-            current = self.__head
-            while current:
-                if count == index - 1:
-                    break
-                current = current.next
-                count += 1
+            node = SinglyNode(x)
+            if self.__lookup is not None:
+                self.__track(node)
+            current = self.__node_at(index - 1)
             node.next = current.next
             current.next = node
             self.__size += 1
             self.shape = tuple([self.__size])
+        if handle:
+            return NodeHandle(node, self, self.__epoch)
+
+    def insert_after(self, handle: NodeHandle, x) -> NodeHandle:
+        """
+        Adds an element `x` right after the element of a `handle` in O(1) and returns a handle to it.
+
+        Raises `ValueError` if `handle` no longer refers to an element of the linked list.
+        """
+        current = self.__node_of(handle)
+        node = SinglyNode(x)
+        if self.__lookup is not None:
+            self.__track(node)
+        node.next = current.next
+        current.next = node
+        if current is self.__tail:
+            self.__tail = node
+        # The new node's position relative to the finger is unknown.
+        self.__finger = None
+        self.__size += 1
+        self.shape = tuple([self.__size])
+        return NodeHandle(node, self, self.__epoch)
 
     def pop(self, index: Union[int, None] = None):
         """
         Removes and returns the element at a given `index` of the linked list.
 
         Doesn't support negative indexing; raises `IndexError` if `index` is out of range.
+
+        Removing the last element needs its predecessor, which is only O(1) when the finger
+        is already there, e.g. in append/pop pairs. In stack mode `pop()` without an `index`
+        removes the first element in O(1) instead.
         """
         if index is not None and not isinstance(index, int):
             raise TypeError(
@@ -212,49 +657,204 @@ class SinglyLinkedList:
         if not self.__head:
             raise IndexError("pop from empty linked list")
         if index is None:
-            if self.__size == 1:
-                value = self.__head.value
-                self.__head = None
-                self.__size = 0
-                self.shape = tuple([self.__size])
-                return value
-            count = 0
-            current = self.__head
-            while current:
-                if count == self.__size - 2:
-                    break
-                current = current.next
-                count += 1
-            value = current.next.value
-            self.__tail = current
-            self.__tail.next = None
-            self.__size -= 1
-            self.shape = tuple([self.__size])
-            return value
-        if index < 0 or index >= self.__size:
+            if self.__stack:
+                return self.popleft()
+            index = self.__size - 1
+        elif index < 0 or index >= self.__size:
             raise IndexError("pop index out of range")
         if index == 0:
-            value = self.__head.value
-            self.__head = self.__head.next
-            self.__size -= 1
-            self.shape = tuple([self.__size])
-            return value
-        count = 0
-        current = self.__head
-        while current:
-            if count == index - 1:
-                break
-            current = current.next
-            count += 1
-        value = current.next.value
-        if index == self.__size - 1:
+            return self.popleft()
+        current = self.__node_at(index - 1)
+        node = current.next
+        current.next = node.next
+        if node is self.__tail:
             self.__tail = current
-            self.__tail.next = None
+        if self.__lookup is not None:
+            self.__untrack(node)
+        node.next = node
+        self.__size -= 1
+        self.shape = tuple([self.__size])
+        return node.value
+
+    def get_many(self, indexes: Iterable[int]) -> list:
+        """
+        Returns the elements at the given `indexes`, in the order given.
+
+        Doesn't support negative indexing; raises `IndexError` if any index is out of range.
+
+        The indexes are sorted and visited in a single forward walk, so `k` lookups
+        cost O(n + k log k) instead of O(k * n).
+        """
+        positions = self.__positions(indexes, "linked list index out of range")
+        result = [None] * len(positions)
+        current = None
+        position = 0
+        for i in sorted(range(len(positions)), key=positions.__getitem__):
+            target = positions[i]
+            if current is None:
+                current = self.__node_at(target)
+                position = target
+            while position < target:
+                current = current.next
+                position += 1
+            result[i] = current.value
+        if current is not None:
+            self.__finger = current
+            self.__finger_index = position
+        return result
+
+    def insert_many(self, pairs: Iterable[tuple]) -> None:
+        """
+        Adds each element `x` of the `(index, x)` pairs at its `index`, in a single forward walk.
+
+        Every `index` refers to a position in the linked list before any of the insertions,
+        so the elements end up as if inserted from the highest index down; elements sharing
+        an index keep their given order. As in `insert()`, an `index <= 0` adds at the beginning
+        and an `index >= SinglyLinkedList.size()` adds at the end.
+        """
+        pairs = list(pairs)
+        positions = []
+        for index, _ in pairs:
+            if not isinstance(index, int):
+                raise TypeError(
+                    f"'{type(index).__name__}' object cannot be interpreted as an integer"
+                )
+            positions.append(min(max(index, 0), self.__size))
+        previous = None
+        position = -1
+        for i in sorted(range(len(pairs)), key=positions.__getitem__):
+            target = positions[i] - 1
+            if previous is None and target >= 0:
+                previous = self.__node_at(target)
+                position = target
+            while position < target:
+                previous = previous.next
+                position += 1
+            node = SinglyNode(pairs[i][1])
+            if self.__lookup is not None:
+                self.__track(node)
+            if previous:
+                node.next = previous.next
+                previous.next = node
+            else:
+                node.next = self.__head
+                self.__head = node
+            if not node.next:
+                self.__tail = node
+            previous = node
+        if pairs:
+            self.__finger = previous
+            self.__finger_index = position + len(pairs)
+            self.__size += len(pairs)
+            self.shape = tuple([self.__size])
+
+    def pop_many(self, indexes: Iterable[int]) -> list:
+        """
+        Removes and returns the elements at the given `indexes`, in the order given.
+
+        Every index refers to a position in the linked list before any of the removals.
+        Doesn't support negative indexing; raises `IndexError` if any index is out of range
+        and `ValueError` if an index is repeated, leaving the linked list unchanged.
+
+        The indexes are sorted and removed in a single forward walk, O(n + k log k).
+        """
+        positions = self.__positions(indexes, "pop index out of range")
+        order = sorted(range(len(positions)), key=positions.__getitem__)
+        for i, j in zip(order, order[1:]):
+            if positions[i] == positions[j]:
+                raise ValueError(f"pop index {positions[i]} given more than once")
+        result = [None] * len(positions)
+        if not positions:
+            return result
+        start = positions[order[0]]
+        previous = self.__node_at(start - 1) if start > 0 else None
+        current = previous.next if previous else self.__head
+        position = start
+        for i in order:
+            while position < positions[i]:
+                previous = current
+                current = current.next
+                position += 1
+            following = current.next
+            if previous:
+                previous.next = following
+            else:
+                self.__head = following
+            if current is self.__tail:
+                self.__tail = previous
+            if self.__lookup is not None:
+                self.__untrack(current)
+            current.next = current
+            result[i] = current.value
+            current = following
+            position += 1
+        self.__finger = None
+        self.__size -= len(positions)
+        self.shape = tuple([self.__size])
+        return result
+
+    def appendleft(self, x) -> None:
+        """
+        Adds an element `x` at the beginning of the linked list in O(1).
+        """
+        node = SinglyNode(x)
+        if self.__lookup is not None:
+            self.__track(node)
+        if not self.__head:
+            self.__head = node
+            self.__tail = node
+            self.__size = 1
+            self.shape = tuple([self.__size])
         else:
-            current.next = current.next.next
+            node.next = self.__head
+            self.__head = node
+            if self.__finger is not None:
+                self.__finger_index += 1
+            self.__size += 1
+            self.shape = tuple([self.__size])
+
+    def popleft(self):
+        """
+        Removes and returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("pop from empty linked list")
+        node = self.__head
+        self.__head = node.next
+        if not self.__head:
+            self.__tail = None
+        if self.__finger is node:
+            self.__finger = None
+        elif self.__finger is not None:
+            self.__finger_index -= 1
+        if self.__lookup is not None:
+            self.__untrack(node)
+        node.next = node
         self.__size -= 1
         self.shape = tuple([self.__size])
-        return value
+        return node.value
+
+    def peekleft(self):
+        """
+        Returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("peek from empty linked list")
+        return self.__head.value
+
+    def peek(self):
+        """
+        Returns the last element of the linked list in O(1), or the first in stack mode.
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("peek from empty linked list")
+        return self.__head.value if self.__stack else self.__tail.value
 
     def remove(self, x) -> None:
         """
@@ -262,78 +862,652 @@ class SinglyLinkedList:
 
         Raises `ValueError` if `x` is not present.
         """
+        # index() leaves the finger on the predecessor, so the pop does not walk again.
         self.pop(self.index(x))
 
     def extend(
         self, x: Union["SinglyLinkedList", "DoublyLinkedList", Iterable]
     ) -> None:
-        "Adds the element(s) of a linked list or an iterable `x` at the end of an existing linked list."
+        """
+        Adds the element(s) of a linked list or an iterable `x` at the end of an existing linked list.
+
+        In stack mode they are pushed one at a time, so they end up in reverse order at the beginning.
+        """
         if (
             not isinstance(x, SinglyLinkedList)
             and not isinstance(x, DoublyLinkedList)
             and not isinstance(x, Iterable)
         ):
             raise TypeError(f"'{type(x).__name__}' object is an invalid type")
-        if isinstance(x, SinglyLinkedList) or isinstance(x, DoublyLinkedList):
-            for i in range(len(x)):
-                self.append(x.get(i))
-        else:
-            for element in x:
-                self.append(element)
-
-    def reverse(self) -> None:
-        """
-        Reverses the order of the elements in the linked list.
-        """
-        _list = []
-        for i in range(len(self)):
-            _list.append(self.get(i))
-        _list.reverse()
-        self.__head = None
-        for element in _list:
+        if x is self:
+            x = list(x)
+        for element in x:
             self.append(element)
 
+    def extendleft(
+        self, x: Union["SinglyLinkedList", "DoublyLinkedList", Iterable]
+    ) -> None:
+        """
+        Adds the element(s) of a linked list or an iterable `x` at the beginning of the linked list, one at a time.
 
-class DoublyLinkedList:
-    """
-    Simple implementation of a doubly linked list.
-
-    Supports negative indexing.
-    """
+        The added elements end up in reverse order, as with `collections.deque.extendleft()`.
+        """
+        if (
+            not isinstance(x, SinglyLinkedList)
+            and not isinstance(x, DoublyLinkedList)
+            and not isinstance(x, Iterable)
+        ):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        for element in x:
+            self.appendleft(element)
 
-    def __init__(
-        self, x: Union["DoublyLinkedList", "SinglyLinkedList", Iterable] = None
-    ) -> None:
-        self.__size: int = 0
-        self.shape: tuple = tuple([self.__size])
+    def clear(self) -> None:
+        """
+        Removes all the elements from the linked list.
+        """
         self.__head = None
         self.__tail = None
-        if x:
-            if (
-                not isinstance(x, DoublyLinkedList)
-                and not isinstance(x, SinglyLinkedList)
-                and not isinstance(x, Iterable)
-            ):
-                raise TypeError(f"'{type(x).__name__}' object is an invalid type")
-            if isinstance(x, DoublyLinkedList) or isinstance(x, SinglyLinkedList):
-                for i in range(len(x)):
-                    self.append(x.get(i))
-            else:
-                for element in x:
-                    self.append(element)
+        self.__finger = None
+        if self.__lookup is not None:
+            self.__lookup = {}
+        self.__epoch += 1
+        self.__size = 0
+        self.shape = tuple([self.__size])
 
-    def __len__(self) -> int:
-        return self.__size
+    def splice(
+        self,
+        other: Union["SinglyLinkedList", "DoublyLinkedList"],
+        index: Union[int, None] = None,
+    ) -> None:
+        """
+        Moves the elements of another linked list `other` before a given `index`, leaving `other` empty.
 
-    def __str__(self) -> str:
-        if not self.__head:
-            return str([])
-        _list = []
+        Doesn't support negative indexing; when `index <= 0` they are added at the beginning,
+        when `index` is `None` or `index >= SinglyLinkedList.size()` at the end.
+
+        Nodes of a `SinglyLinkedList` are relinked instead of copied: O(1) at either end,
+        O(index) otherwise, plus O(len(other)) to index the values if the value index is on.
+        """
+        if index is not None and not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if not isinstance(other, SinglyLinkedList) and not isinstance(
+            other, DoublyLinkedList
+        ):
+            raise TypeError(f"'{type(other).__name__}' object is an invalid type")
+        if other is self:
+            raise ValueError("cannot splice a linked list into itself")
+        if not isinstance(other, SinglyLinkedList):
+            # Doubly linked nodes are not reused; copy them into singly linked ones.
+            moved = SinglyLinkedList(other)
+            other.clear()
+            other = moved
+        if not other.__head:
+            return
+        head, tail, count = other.__head, other.__tail, other.__size
+        other.clear()
+        if self.__lookup is not None:
+            current = head
+            while current:
+                self.__track(current)
+                current = current.next
+        if not self.__head or index is None or index >= self.__size:
+            if self.__tail:
+                self.__tail.next = head
+            else:
+                self.__head = head
+            self.__tail = tail
+        elif index <= 0:
+            tail.next = self.__head
+            self.__head = head
+            if self.__finger is not None:
+                self.__finger_index += count
+        else:
+            current = self.__node_at(index - 1)
+            tail.next = current.next
+            current.next = head
+        self.__size += count
+        self.shape = tuple([self.__size])
+
+    def concat(self, other: Union["SinglyLinkedList", "DoublyLinkedList"]) -> None:
+        """
+        Moves the elements of another linked list `other` to the end, leaving `other` empty.
+
+        O(1) for a `SinglyLinkedList` without a value index; see `splice()`.
+        """
+        self.splice(other)
+
+    def split_at(self, index: int) -> "SinglyLinkedList":
+        """
+        Removes the elements from a given `index` onwards and returns them as a new linked list.
+
+        Doesn't support negative indexing; raises `IndexError` unless `0 <= index <= SinglyLinkedList.size()`.
+
+        The nodes are moved, not copied, after an O(index) walk; with a value index the
+        moved values are re-indexed in O(size() - index).
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0 or index > self.__size:
+            raise IndexError("split index out of range")
+        result = type(self)(indexed=self.__lookup is not None)
+        if index == self.__size:
+            return result
+        self.__epoch += 1
+        head, tail = self.__head, self.__tail
+        if index == 0:
+            result.__lookup, self.__lookup = self.__lookup, result.__lookup
+            self.__head = None
+            self.__tail = None
+            self.__finger = None
+        else:
+            current = self.__node_at(index - 1)
+            head = current.next
+            current.next = None
+            self.__tail = current
+            if self.__lookup is not None:
+                current = head
+                while current:
+                    self.__untrack(current)
+                    result.__track(current)
+                    current = current.next
+        result.__head = head
+        result.__tail = tail
+        result.__size = self.__size - index
+        result.shape = tuple([result.__size])
+        self.__size = index
+        self.shape = tuple([self.__size])
+        return result
+
+    def sort(self, key: Union[Callable, None] = None, reverse: bool = False) -> None:
+        """
+        Sorts the elements of the linked list in place, like the `sort()` method of list.
+
+        A stable bottom-up merge sort that relinks the existing nodes:
+        O(n log n) time and O(1) extra memory. Unlike `list.sort()`, which calls `key` once
+        per element, it calls `key` O(n log n) times, on every comparison.
+        """
+        if self.__size < 2:
+            return
+        self.__head, self.__tail, error = _merge_sort(
+            self.__head, self.__size, key, reverse
+        )
+        self.__finger = None
+        if error is not None:
+            raise error
+
+    def merge(
+        self,
+        other: Union["SinglyLinkedList", "DoublyLinkedList"],
+        key: Union[Callable, None] = None,
+        reverse: bool = False,
+    ) -> None:
+        """
+        Merges the elements of another linked list `other` into the linked list, leaving `other` empty.
+
+        Both linked lists must already be sorted with the same `key` and `reverse`; the
+        result is sorted and stable, with ties keeping the elements of this linked list first.
+        Nodes of a `SinglyLinkedList` are relinked instead of copied, in O(n + len(other)).
+        If `key` or a comparison raises, the exception propagates and the linked list still
+        holds every element of both.
+        """
+        if not isinstance(other, SinglyLinkedList) and not isinstance(
+            other, DoublyLinkedList
+        ):
+            raise TypeError(f"'{type(other).__name__}' object is an invalid type")
+        if other is self:
+            raise ValueError("cannot merge a linked list into itself")
+        if not isinstance(other, SinglyLinkedList):
+            moved = SinglyLinkedList(other)
+            other.clear()
+            other = moved
+        if not other.__head:
+            return
+        head, count = other.__head, other.__size
+        other.clear()
+        if self.__lookup is not None:
+            current = head
+            while current:
+                self.__track(current)
+                current = current.next
+        self.__head, self.__tail, error = _merge(self.__head, head, key, reverse)
+        self.__finger = None
+        self.__size += count
+        self.shape = tuple([self.__size])
+        if error is not None:
+            raise error
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the elements in the linked list.
+
+        Reverses the `next` links in place in O(n) without allocating.
+        """
+        previous = None
+        current = self.__tail = self.__head
+        while current:
+            following = current.next
+            current.next = previous
+            previous = current
+            current = following
+        self.__head = previous
+        if self.__finger is not None:
+            self.__finger_index = self.__size - 1 - self.__finger_index
+
+    def lazy(self) -> "LazyPipeline":
+        """
+        Returns a lazy pipeline over the elements, e.g. `ll.lazy().map(f).filter(p).take(n).to_singly()`.
+
+        Stages are only evaluated by a terminal operation, which walks the nodes once; see `lazy.LazyPipeline`.
+        """
+        # Imported here as lazy.py builds on this module.
+        from lazy import LazyPipeline
+
+        return LazyPipeline(self)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the elements of the linked list in the chunked binary format of `serialization`.
+
+        Runs of `int` or `float` are stored as packed 64-bit arrays, anything else is pickled.
+        """
+        return serialization.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, indexed: bool = False) -> "SinglyLinkedList":
+        """
+        Returns a new linked list holding the elements serialized in `data` by `to_bytes()`.
+
+        Only load data from trusted sources: non-numeric values are unpickled.
+        """
+        return cls(serialization.loads(data), indexed)
+
+    def dump(self, fileobj) -> None:
+        """
+        Writes the elements of the linked list to a binary file object `fileobj`, one chunk at a time.
+        """
+        serialization.dump(self, fileobj)
+
+    @classmethod
+    def load(cls, fileobj, indexed: bool = False) -> "SinglyLinkedList":
+        """
+        Returns a new linked list holding the elements written by `dump()` to a binary file object `fileobj`.
+
+        Reads one chunk at a time and stops at the end of the dumped elements. Only load data
+        from trusted sources: non-numeric values are unpickled.
+        """
+        return cls(serialization.load(fileobj), indexed)
+
+    def to_jsonl(self, path: str) -> None:
+        """
+        Writes the elements of the linked list to the file at `path` as JSON Lines, one chunk at a time.
+        """
+        serialization.dump_jsonl(self, path)
+
+    @classmethod
+    def from_jsonl(cls, path: str, indexed: bool = False) -> "SinglyLinkedList":
+        """
+        Returns a new linked list holding the elements of the JSON Lines file at `path`.
+
+        Reads the file a line at a time, so only the linked list itself grows with its size.
+        """
+        return cls(serialization.load_jsonl(path), indexed)
+
+    def to_csv(self, path: str) -> None:
+        """
+        Writes the elements of the linked list to the file at `path` as CSV rows, one chunk at a time.
+
+        A `list` or `tuple` element becomes a row of its fields, any other element a single-field row.
+        """
+        serialization.dump_csv(self, path)
+
+    @classmethod
+    def from_csv(cls, path: str, indexed: bool = False) -> "SinglyLinkedList":
+        """
+        Returns a new linked list holding the rows of the CSV file at `path`, each as a `list` of strings.
+        """
+        return cls(serialization.load_csv(path), indexed)
+
+
+class DoublyLinkedList:
+    """
+    Simple implementation of a doubly linked list.
+
+    Supports negative indexing.
+
+    With `indexed=True` it keeps a map from each hashable value to its nodes, so
+    membership tests, `count()`, rejecting a missing value and removing a value
+    that occurs once are O(1).
+    """
+
+    def __init__(
+        self,
+        x: Union["DoublyLinkedList", "SinglyLinkedList", Iterable] = None,
+        indexed: bool = False,
+    ) -> None:
+        self.__size: int = 0
+        self.shape: tuple = tuple([self.__size])
+        self.__head = None
+        self.__tail = None
+        # Last node reached by a positional walk and its index.
+        self.__finger = None
+        self.__finger_index: int = 0
+        # Optional value -> {node: None} map.
+        self.__lookup = {} if indexed else None
+        # Bumped whenever nodes leave in bulk, which invalidates every handle at once.
+        self.__epoch: int = 0
+        if x:
+            self.extend(x)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, x) -> bool:
+        nodes = self.__nodes_of(x)
+        if nodes is not None:
+            return bool(nodes)
+        return self.__find(x)[1] is not None
+
+    def __iter__(self) -> Iterator:
+        current = self.__head
+        while current:
+            following = current.next
+            if following is current:
+                raise RuntimeError("linked list changed during iteration")
+            yield current.value
+            current = following
+
+    def __reversed__(self) -> Iterator:
+        current = self.__tail
+        while current:
+            following = current.prev
+            if following is current:
+                raise RuntimeError("linked list changed during iteration")
+            yield current.value
+            current = following
+
+    def __str__(self) -> str:
+        return _preview(self, self.__size)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({_preview(self, self.__size)})"
+
+    def __reduce__(self) -> tuple:
+        # Pickle the values as one flat list rather than recursing through the nodes.
+        return type(self), (list(self), self.__lookup is not None)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__size))
+            result = type(self)(indexed=self.__lookup is not None)
+            if positions:
+                result.extend(node.value for node in self.__walk(positions))
+            return result
+        return self.get(key)
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__size))
+            values = list(value)
+            if positions.step == 1:
+                self.__replace_range(positions.start, len(positions), values)
+                return
+            if len(values) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} to extended slice of size {len(positions)}"
+                )
+            if positions:
+                for node, element in zip(self.__walk(positions), values):
+                    self.__replace(node, element)
+            return
+        if not isinstance(key, int):
+            raise TypeError(
+                f"'{type(key).__name__}' object cannot be interpreted as an integer"
+            )
+        if abs(key) > self.__size or key >= self.__size:
+            raise IndexError("linked list assignment index out of range")
+        if key < 0:
+            key += self.__size
+        self.__replace(self.__node_at(key), value)
+
+    def __delitem__(self, key) -> None:
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__size))
+            if not positions:
+                return
+            if positions.step == 1:
+                self.__replace_range(positions.start, len(positions), [])
+                return
+            if positions.step < 0:
+                positions = positions[::-1]
+            current = self.__node_at(positions[0])
+            for _ in range(len(positions) - 1):
+                following = current.next
+                self.__unlink(current)
+                current = following
+                for _ in range(positions.step - 1):
+                    current = current.next
+            self.__unlink(current)
+            self.__finger = None
+            return
+        if not isinstance(key, int):
+            raise TypeError(
+                f"'{type(key).__name__}' object cannot be interpreted as an integer"
+            )
+        if abs(key) > self.__size or key >= self.__size:
+            raise IndexError("linked list assignment index out of range")
+        self.pop(key)
+
+    def __node_at(self, index: int):
+        """
+        Returns the node at an in-range, non-negative `index`.
+
+        Walks from whichever of the head, the tail and the finger is closest to `index`.
+        """
+        current = self.__head
+        count = 0
+        distance = index
+        if self.__size - 1 - index < distance:
+            current = self.__tail
+            count = self.__size - 1
+            distance = count - index
+        if self.__finger is not None and abs(index - self.__finger_index) < distance:
+            current = self.__finger
+            count = self.__finger_index
+        while count < index:
+            current = current.next
+            count += 1
+        while count > index:
+            current = current.prev
+            count -= 1
+        self.__finger = current
+        self.__finger_index = index
+        return current
+
+    def __track(self, node) -> None:
+        try:
+            self.__lookup.setdefault(node.value, {})[node] = None
+        except TypeError:
+            pass
+
+    def __untrack(self, node) -> None:
+        try:
+            nodes = self.__lookup[node.value]
+        except TypeError:
+            return
+        del nodes[node]
+        if not nodes:
+            del self.__lookup[node.value]
+
+    def __nodes_of(self, x):
+        """
+        Returns the indexed nodes holding `x`, or `None` when there is no value index
+        or `x` is unhashable.
+        """
+        if self.__lookup is None:
+            return None
+        try:
+            return self.__lookup.get(x, {})
+        except TypeError:
+            return None
+
+    def __find(self, x) -> tuple:
+        """
+        Returns the index of the first node holding `x` and the node, or `(-1, None)`.
+        """
+        nodes = self.__nodes_of(x)
+        if nodes is not None and not nodes:
+            return -1, None
+        index = 0
+        current = self.__head
+        while current:
+            if current in nodes if nodes is not None else x == current.value:
+                return index, current
+            current = current.next
+            index += 1
+        return -1, None
+
+    def __unlink(self, node) -> None:
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.__head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.__tail = node.prev
+        if self.__lookup is not None:
+            self.__untrack(node)
+        node.next = node.prev = node
+        self.__size -= 1
+        self.shape = tuple([self.__size])
+
+    def __relink_prev(self) -> None:
+        """
+        Rebuilds the `prev` links from the `next` links.
+        """
+        previous = None
         current = self.__head
         while current:
-            _list.append(current.value)
+            current.prev = previous
+            previous = current
             current = current.next
-        return str(_list)
+
+    def __walk(self, positions: range) -> Iterator:
+        """
+        Yields the nodes at non-empty `positions` in a single walk, following `prev` links
+        for a negative step.
+
+        Leaves the finger on the last yielded node.
+        """
+        current = self.__node_at(positions[0])
+        yield current
+        step = positions.step
+        for _ in range(len(positions) - 1):
+            if step > 0:
+                for _ in range(step):
+                    current = current.next
+            else:
+                for _ in range(-step):
+                    current = current.prev
+            yield current
+        self.__finger = current
+        self.__finger_index = positions[-1]
+
+    def __replace(self, node, x) -> None:
+        if self.__lookup is not None:
+            self.__untrack(node)
+            node.value = x
+            self.__track(node)
+        else:
+            node.value = x
+
+    def __replace_range(self, start: int, count: int, values: list) -> None:
+        """
+        Replaces the `count` nodes from `start` with a new chain holding `values`.
+
+        Leaves the finger on the node before `start`.
+        """
+        if start >= self.__size:
+            previous, current = self.__tail, None
+        else:
+            current = self.__node_at(start)
+            previous = current.prev
+            for _ in range(count):
+                if self.__lookup is not None:
+                    self.__untrack(current)
+                following = current.next
+                current.next = current.prev = current
+                current = following
+        head = tail = None
+        for element in values:
+            node = Node(element)
+            if self.__lookup is not None:
+                self.__track(node)
+            if tail:
+                tail.next = node
+                node.prev = tail
+            else:
+                head = node
+            tail = node
+        if head:
+            head.prev = previous
+            tail.next = current
+        if previous:
+            previous.next = head or current
+            self.__finger = previous
+            self.__finger_index = start - 1
+        else:
+            self.__head = head or current
+            self.__finger = None
+        if current:
+            current.prev = tail or previous
+        else:
+            self.__tail = tail or previous
+        self.__size += len(values) - count
+        self.shape = tuple([self.__size])
+
+    def __positions(self, indexes: Iterable[int], message: str) -> list:
+        """
+        Returns `indexes` with negative ones made non-negative, raising `IndexError`
+        with `message` if any is out of range.
+        """
+        positions = list(indexes)
+        for i, index in enumerate(positions):
+            if not isinstance(index, int):
+                raise TypeError(
+                    f"'{type(index).__name__}' object cannot be interpreted as an integer"
+                )
+            if abs(index) > self.__size or index >= self.__size:
+                raise IndexError(message)
+            if index < 0:
+                positions[i] = index + self.__size
+        return positions
+
+    def __node_of(self, handle: NodeHandle):
+        """
+        Returns the node of a `handle` to an element of this linked list.
+
+        Raises `ValueError` if the element has been removed or the handle belongs elsewhere;
+        removed nodes link to themselves, which is how they are told apart.
+        """
+        if not isinstance(handle, NodeHandle):
+            raise TypeError(f"'{type(handle).__name__}' object is not a node handle")
+        node = handle._node
+        if (
+            handle._owner is not self
+            or handle._epoch != self.__epoch
+            or node.next is node
+        ):
+            raise ValueError(
+                "node handle does not refer to an element of the linked list"
+            )
+        return node
 
     def size(self) -> int:
         """
@@ -346,6 +1520,9 @@ class DoublyLinkedList:
         Returns the element at a given `index` of the linked list.
 
         Supports negative indexing; raises `IndexError` if `index` is out of range.
+
+        Walks from the nearest of the head, the tail and the last visited position,
+        so sequential and nearby access is amortized O(1).
         """
         if not isinstance(index, int):
             raise TypeError(
@@ -354,47 +1531,44 @@ class DoublyLinkedList:
         if abs(index) > self.__size or index >= self.__size:
             raise IndexError("linked list index out of range")
         if index < 0:
-            count = -1
-            current = self.__tail
-            while current:
-                if count == index:
-                    break
-                current = current.prev
-                count -= 1
-            return current.value
-        count = 0
-        current = self.__head
-        while current:
-            if count == index:
-                break
-            current = current.next
-            count += 1
-        return current.value
+            index += self.__size
+        return self.__node_at(index).value
 
     def index(self, x) -> int:
         """
         Returns the index of the first occurrence of an element `x` in the linked list.
 
-        Raises `ValueError` if `x` is not present.
+        Raises `ValueError` if `x` is not present; with a value index that check is O(1).
         """
-        index = 0
-        current = self.__head
-        while current:
-            if x == current.value:
-                break
-            current = current.next
-            index += 1
-        if not self.__head or index == self.__size:
+        index, node = self.__find(x)
+        if node is None:
             raise ValueError(
                 f"{repr(x) if isinstance(x, str) else x} is not in linked list"
             )
+        self.__finger = node
+        self.__finger_index = index
         return index
 
-    def append(self, x) -> None:
+    def count(self, x) -> int:
+        """
+        Returns the number of occurrences of an element `x` in the linked list.
+
+        O(1) with a value index when `x` is hashable.
+        """
+        nodes = self.__nodes_of(x)
+        if nodes is not None:
+            return len(nodes)
+        return sum(1 for value in self if x == value)
+
+    def append(self, x, handle: bool = False) -> Union[NodeHandle, None]:
         """
         Adds an element `x` at the end of the linked list.
+
+        Returns a `NodeHandle` to the new element if `handle` is true.
         """
         node = Node(x)
+        if self.__lookup is not None:
+            self.__track(node)
         if not self.__head:
             self.__head = node
             self.__tail = node
@@ -406,81 +1580,100 @@ class DoublyLinkedList:
             self.__tail = node
             self.__size += 1
             self.shape = tuple([self.__size])
+        if handle:
+            return NodeHandle(node, self, self.__epoch)
 
-    def insert(self, index: int, x) -> None:
+    def insert(self, index: int, x, handle: bool = False) -> Union[NodeHandle, None]:
         """
         Adds an element `x` at a given `index` of the linked list.
 
         Supports negative indexing; behaves exactly as the `insert()` method of list.
+
+        Returns a `NodeHandle` to the new element if `handle` is true.
         """
         if not isinstance(index, int):
             raise TypeError(
                 f"'{type(index).__name__}' object cannot be interpreted as an integer"
             )
         if index < 0:
-            node = Node(x)
-            if abs(index) >= self.__size:
-                if not self.__head:
-                    self.__head = node
-                    self.__tail = node
-                    self.__size = 1
-                    self.shape = tuple([self.__size])
-                else:
-                    node.next = self.__head
-                    self.__head.prev = node
-                    self.__head = node
-                    self.__size += 1
-                    self.shape = tuple([self.__size])
-            else:
-                if not self.__head:
-                    self.__head = node
-                    self.__tail = node
-                    self.__size = 1
-                    self.shape = tuple([self.__size])
-                else:
-                    count = -1
-                    current = self.__tail
-                    while current:
-                        if count == index - 1:
-                            break
-                        current = current.prev
-                        count -= 1
-                    node.next = current.next
-                    current.next.prev = node
-                    node.prev = current
-                    current.next = node
-                    self.__size += 1
-                    self.shape = tuple([self.__size])
-        elif index == 0:
-            node = Node(x)
-            if not self.__head:
-                self.__head = node
-                self.__tail = node
-                self.__size = 1
-                self.shape = tuple([self.__size])
-            else:
-                self.__head.prev = node
-                node.next = self.__head
-                self.__head = node
-                self.__size += 1
-                self.shape = tuple([self.__size])
-        elif index >= self.__size:
-            self.append(x)
+            index = max(index + self.__size, 0)
+        if index >= self.__size:
+            return self.append(x, handle)
+        if index == 0:
+            self.appendleft(x)
+            node = self.__head
         else:
             node = Node(x)
-            count = 0
-            current = self.__head
-            while current:
-                if count == index - 1:
-                    break
-                current = current.next
-                count += 1
-            node.next = current.next
-            current.next.prev = node
-            node.prev = current
-            current.next = node
+            if self.__lookup is not None:
+                self.__track(node)
+            current = self.__node_at(index)
+            node.next = current
+            node.prev = current.prev
+            current.prev.next = node
+            current.prev = node
+            self.__finger = node
             self.__size += 1
             self.shape = tuple([self.__size])
+        if handle:
+            return NodeHandle(node, self, self.__epoch)
+
+    def insert_after(self, handle: NodeHandle, x) -> NodeHandle:
+        """
+        Adds an element `x` right after the element of a `handle` in O(1) and returns a handle to it.
+
+        Raises `ValueError` if `handle` no longer refers to an element of the linked list.
+        """
+        current = self.__node_of(handle)
+        if current is self.__tail:
+            return self.append(x, True)
+        node = Node(x)
+        if self.__lookup is not None:
+            self.__track(node)
+        node.prev = current
+        node.next = current.next
+        current.next.prev = node
+        current.next = node
+        # The new node's position relative to the finger is unknown.
+        self.__finger = None
+        self.__size += 1
+        self.shape = tuple([self.__size])
+        return NodeHandle(node, self, self.__epoch)
+
+    def insert_before(self, handle: NodeHandle, x) -> NodeHandle:
+        """
+        Adds an element `x` right before the element of a `handle` in O(1) and returns a handle to it.
+
+        Raises `ValueError` if `handle` no longer refers to an element of the linked list.
+        """
+        current = self.__node_of(handle)
+        if current is self.__head:
+            self.appendleft(x)
+            return NodeHandle(self.__head, self, self.__epoch)
+        return self.insert_after(NodeHandle(current.prev, self, self.__epoch), x)
+
+    def remove_node(self, handle: NodeHandle):
+        """
+        Removes the element of a `handle` in O(1) and returns it.
+
+        Raises `ValueError` if `handle` no longer refers to an element of the linked list.
+        """
+        node = self.__node_of(handle)
+        if self.__finger is node and node.prev:
+            self.__finger = node.prev
+            self.__finger_index -= 1
+        else:
+            # The node's position relative to the finger is unknown.
+            self.__finger = None
+        self.__unlink(node)
+        return node.value
+
+    def move_to_end(self, handle: NodeHandle) -> None:
+        """
+        Moves the element of a `handle` to the end of the linked list in O(1).
+
+        Raises `ValueError` if `handle` no longer refers to an element of the linked list.
+        """
+        self._move_node_to_end(self.__node_of(handle))
 
     def pop(self, index: Union[int, None] = None):
         """
@@ -497,77 +1690,184 @@ class DoublyLinkedList:
         if not self.__head:
             raise IndexError("pop from empty linked list")
         if index is None:
-            if self.__size == 1:
-                value = self.__head.value
-                self.__head = None
-                self.__size = 0
-                self.shape = tuple([self.__size])
-                return value
-            value = self.__tail.value
-            self.__tail = self.__tail.prev
-            self.__tail.next = None
-            self.__size -= 1
-            self.shape = tuple([self.__size])
-            return value
-        if index < 0:
+            index = self.__size - 1
+        elif index < 0:
             if abs(index) > self.__size:
                 raise IndexError("pop index out of range")
-            if index == -1:
-                value = self.__tail.value
-                self.__tail = self.__tail.prev
-                self.__tail.next = None
-                self.__size -= 1
-                self.shape = tuple([self.__size])
-                return value
-            if abs(index) == self.__size:
-                value = self.__head.value
-                self.__head.next.prev = None
-                self.__head = self.__head.next
-                self.__size -= 1
-                self.shape = tuple([self.__size])
-                return value
-            count = -1
-            current = self.__tail
-            while current:
-                if count == index:
-                    break
-                current = current.prev
-                count -= 1
-            value = current.value
-            current.prev.next = current.next
-            current.next.prev = current.prev
-            self.__size -= 1
-            self.shape = tuple([self.__size])
-            return value
-        if index >= self.__size:
+            index += self.__size
+        elif index >= self.__size:
             raise IndexError("pop index out of range")
-        if index == 0:
-            value = self.__head.value
-            self.__head.next.prev = None
-            self.__head = self.__head.next
-            self.__size -= 1
-            self.shape = tuple([self.__size])
-            return value
-        if index == self.__size - 1:
-            value = self.__tail.value
-            self.__tail = self.__tail.prev
-            self.__tail.next = None
-            self.__size -= 1
+        node = self.__node_at(index)
+        if node.prev:
+            self.__finger = node.prev
+            self.__finger_index = index - 1
+        else:
+            self.__finger = node.next
+        self.__unlink(node)
+        return node.value
+
+    def get_many(self, indexes: Iterable[int]) -> list:
+        """
+        Returns the elements at the given `indexes`, in the order given.
+
+        Supports negative indexing; raises `IndexError` if any index is out of range.
+
+        The indexes are sorted and visited in a single forward walk, so `k` lookups
+        cost O(n + k log k) instead of O(k * n).
+        """
+        positions = self.__positions(indexes, "linked list index out of range")
+        result = [None] * len(positions)
+        current = None
+        position = 0
+        for i in sorted(range(len(positions)), key=positions.__getitem__):
+            target = positions[i]
+            if current is None:
+                current = self.__node_at(target)
+                position = target
+            while position < target:
+                current = current.next
+                position += 1
+            result[i] = current.value
+        if current is not None:
+            self.__finger = current
+            self.__finger_index = position
+        return result
+
+    def insert_many(self, pairs: Iterable[tuple]) -> None:
+        """
+        Adds each element `x` of the `(index, x)` pairs at its `index`, in a single walk.
+
+        Every `index` refers to a position in the linked list before any of the insertions,
+        so the elements end up as if inserted from the highest index down; elements sharing
+        an index keep their given order. Indexes are interpreted as by `insert()`.
+        """
+        pairs = list(pairs)
+        positions = []
+        for index, _ in pairs:
+            if not isinstance(index, int):
+                raise TypeError(
+                    f"'{type(index).__name__}' object cannot be interpreted as an integer"
+                )
+            if index < 0:
+                index = max(index + self.__size, 0)
+            positions.append(min(index, self.__size))
+        previous = None
+        position = -1
+        for i in sorted(range(len(pairs)), key=positions.__getitem__):
+            target = positions[i] - 1
+            if previous is None and target >= 0:
+                previous = self.__node_at(target)
+                position = target
+            while position < target:
+                previous = previous.next
+                position += 1
+            node = Node(pairs[i][1])
+            if self.__lookup is not None:
+                self.__track(node)
+            following = previous.next if previous else self.__head
+            node.prev = previous
+            node.next = following
+            if previous:
+                previous.next = node
+            else:
+                self.__head = node
+            if following:
+                following.prev = node
+            else:
+                self.__tail = node
+            previous = node
+        if pairs:
+            self.__finger = previous
+            self.__finger_index = position + len(pairs)
+            self.__size += len(pairs)
             self.shape = tuple([self.__size])
-            return value
-        count = 0
-        current = self.__head
-        while current:
-            if count == index:
-                break
-            current = current.next
-            count += 1
-        value = current.value
-        current.prev.next = current.next
-        current.next.prev = current.prev
-        self.__size -= 1
+
+    def pop_many(self, indexes: Iterable[int]) -> list:
+        """
+        Removes and returns the elements at the given `indexes`, in the order given.
+
+        Every index refers to a position in the linked list before any of the removals.
+        Supports negative indexing; raises `IndexError` if any index is out of range
+        and `ValueError` if an index is repeated, leaving the linked list unchanged.
+
+        The indexes are sorted and removed in a single walk, O(n + k log k).
+        """
+        positions = self.__positions(indexes, "pop index out of range")
+        order = sorted(range(len(positions)), key=positions.__getitem__)
+        for i, j in zip(order, order[1:]):
+            if positions[i] == positions[j]:
+                raise ValueError(f"pop index {positions[i]} given more than once")
+        result = [None] * len(positions)
+        if not positions:
+            return result
+        current = self.__node_at(positions[order[0]])
+        position = positions[order[0]]
+        for i in order:
+            while position < positions[i]:
+                current = current.next
+                position += 1
+            following = current.next
+            self.__unlink(current)
+            result[i] = current.value
+            current = following
+            position += 1
+        self.__finger = None
+        return result
+
+    def appendleft(self, x) -> None:
+        """
+        Adds an element `x` at the beginning of the linked list in O(1).
+        """
+        node = Node(x)
+        if self.__lookup is not None:
+            self.__track(node)
+        if not self.__head:
+            self.__head = node
+            self.__tail = node
+        else:
+            node.next = self.__head
+            self.__head.prev = node
+            self.__head = node
+            if self.__finger is not None:
+                self.__finger_index += 1
+        self.__size += 1
         self.shape = tuple([self.__size])
-        return value
+
+    def popleft(self):
+        """
+        Removes and returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("pop from empty linked list")
+        node = self.__head
+        if self.__finger is node:
+            self.__finger = node.next
+        elif self.__finger is not None:
+            self.__finger_index -= 1
+        self.__unlink(node)
+        return node.value
+
+    def peekleft(self):
+        """
+        Returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("peek from empty linked list")
+        return self.__head.value
+
+    def peek(self):
+        """
+        Returns the last element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("peek from empty linked list")
+        return self.__tail.value
 
     def remove(self, x) -> None:
         """
@@ -575,6 +1875,18 @@ class DoublyLinkedList:
 
         Raises `ValueError` if `x` is not present.
         """
+        nodes = self.__nodes_of(x)
+        if nodes is not None and len(nodes) == 1:
+            node = next(iter(nodes))
+            if self.__finger is node:
+                self.__finger = node.prev
+                self.__finger_index -= 1
+            else:
+                # The node's position relative to the finger is unknown.
+                self.__finger = None
+            self.__unlink(node)
+            return
+        # index() leaves the finger on the match, so the pop does not walk again.
         self.pop(self.index(x))
 
     def extend(
@@ -587,12 +1899,230 @@ class DoublyLinkedList:
             and not isinstance(x, Iterable)
         ):
             raise TypeError(f"'{type(x).__name__}' object is an invalid type")
-        if isinstance(x, DoublyLinkedList) or isinstance(x, SinglyLinkedList):
-            for i in range(len(x)):
-                self.append(x.get(i))
+        if x is self:
+            x = list(x)
+        for element in x:
+            self.append(element)
+
+    def extendleft(
+        self, x: Union["DoublyLinkedList", "SinglyLinkedList", Iterable]
+    ) -> None:
+        """
+        Adds the element(s) of a linked list or an iterable `x` at the beginning of the linked list, one at a time.
+
+        The added elements end up in reverse order, as with `collections.deque.extendleft()`.
+        """
+        if (
+            not isinstance(x, DoublyLinkedList)
+            and not isinstance(x, SinglyLinkedList)
+            and not isinstance(x, Iterable)
+        ):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        for element in x:
+            self.appendleft(element)
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the linked list.
+        """
+        self.__head = None
+        self.__tail = None
+        self.__finger = None
+        if self.__lookup is not None:
+            self.__lookup = {}
+        self.__epoch += 1
+        self.__size = 0
+        self.shape = tuple([self.__size])
+
+    def splice(
+        self,
+        other: Union["DoublyLinkedList", "SinglyLinkedList"],
+        index: Union[int, None] = None,
+    ) -> None:
+        """
+        Moves the elements of another linked list `other` before a given `index`, leaving `other` empty.
+
+        Supports negative indexing like `insert()`; they are added at the end when `index` is `None`.
+
+        Nodes of a `DoublyLinkedList` are relinked instead of copied: O(1) at either end,
+        O(distance from the nearest end) otherwise, plus O(len(other)) to index the values
+        if the value index is on.
+        """
+        if index is not None and not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if not isinstance(other, DoublyLinkedList) and not isinstance(
+            other, SinglyLinkedList
+        ):
+            raise TypeError(f"'{type(other).__name__}' object is an invalid type")
+        if other is self:
+            raise ValueError("cannot splice a linked list into itself")
+        if not isinstance(other, DoublyLinkedList):
+            # Singly linked nodes have no prev link; copy them into doubly linked ones.
+            moved = DoublyLinkedList(other)
+            other.clear()
+            other = moved
+        if not other.__head:
+            return
+        head, tail, count = other.__head, other.__tail, other.__size
+        other.clear()
+        if self.__lookup is not None:
+            current = head
+            while current:
+                self.__track(current)
+                current = current.next
+        if index is not None and index < 0:
+            index = max(index + self.__size, 0)
+        if not self.__head or index is None or index >= self.__size:
+            if self.__tail:
+                self.__tail.next = head
+                head.prev = self.__tail
+            else:
+                self.__head = head
+            self.__tail = tail
+        elif index == 0:
+            tail.next = self.__head
+            self.__head.prev = tail
+            self.__head = head
+            if self.__finger is not None:
+                self.__finger_index += count
+        else:
+            current = self.__node_at(index)
+            head.prev = current.prev
+            current.prev.next = head
+            tail.next = current
+            current.prev = tail
+            self.__finger_index += count
+        self.__size += count
+        self.shape = tuple([self.__size])
+
+    def concat(self, other: Union["DoublyLinkedList", "SinglyLinkedList"]) -> None:
+        """
+        Moves the elements of another linked list `other` to the end, leaving `other` empty.
+
+        O(1) for a `DoublyLinkedList` without a value index; see `splice()`.
+        """
+        self.splice(other)
+
+    def split_at(self, index: int) -> "DoublyLinkedList":
+        """
+        Removes the elements from a given `index` onwards and returns them as a new linked list.
+
+        Supports negative indexing; raises `IndexError` unless `-size() <= index <= size()`.
+
+        The nodes are moved, not copied, after a walk from the nearest end; with a value
+        index the moved values are re-indexed in O(size() - index).
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0:
+            index += self.__size
+        if index < 0 or index > self.__size:
+            raise IndexError("split index out of range")
+        result = type(self)(indexed=self.__lookup is not None)
+        if index == self.__size:
+            return result
+        self.__epoch += 1
+        tail = self.__tail
+        if index == 0:
+            head = self.__head
+            result.__lookup, self.__lookup = self.__lookup, result.__lookup
+            self.__head = None
+            self.__tail = None
+            self.__finger = None
         else:
-            for element in x:
-                self.append(element)
+            head = self.__node_at(index)
+            self.__tail = head.prev
+            self.__tail.next = None
+            head.prev = None
+            self.__finger = self.__tail
+            self.__finger_index = index - 1
+            if self.__lookup is not None:
+                current = head
+                while current:
+                    self.__untrack(current)
+                    result.__track(current)
+                    current = current.next
+        result.__head = head
+        result.__tail = tail
+        result.__size = self.__size - index
+        result.shape = tuple([result.__size])
+        self.__size = index
+        self.shape = tuple([self.__size])
+        return result
+
+    def sort(self, key: Union[Callable, None] = None, reverse: bool = False) -> None:
+        """
+        Sorts the elements of the linked list in place, like the `sort()` method of list.
+
+        A stable bottom-up merge sort that relinks the existing nodes:
+        O(n log n) time and O(1) extra memory. Unlike `list.sort()`, which calls `key` once
+        per element, it calls `key` O(n log n) times, on every comparison.
+        """
+        if self.__size < 2:
+            return
+        self.__head, self.__tail, error = _merge_sort(
+            self.__head, self.__size, key, reverse
+        )
+        self.__finger = None
+        self.__relink_prev()
+        if error is not None:
+            raise error
+
+    def merge(
+        self,
+        other: Union["DoublyLinkedList", "SinglyLinkedList"],
+        key: Union[Callable, None] = None,
+        reverse: bool = False,
+    ) -> None:
+        """
+        Merges the elements of another linked list `other` into the linked list, leaving `other` empty.
+
+        Both linked lists must already be sorted with the same `key` and `reverse`; the
+        result is sorted and stable, with ties keeping the elements of this linked list first.
+        Nodes of a `DoublyLinkedList` are relinked instead of copied, in O(n + len(other)).
+        If `key` or a comparison raises, the exception propagates and the linked list still
+        holds every element of both.
+        """
+        if not isinstance(other, DoublyLinkedList) and not isinstance(
+            other, SinglyLinkedList
+        ):
+            raise TypeError(f"'{type(other).__name__}' object is an invalid type")
+        if other is self:
+            raise ValueError("cannot merge a linked list into itself")
+        if not isinstance(other, DoublyLinkedList):
+            moved = DoublyLinkedList(other)
+            other.clear()
+            other = moved
+        if not other.__head:
+            return
+        head, count = other.__head, other.__size
+        other.clear()
+        if self.__lookup is not None:
+            current = head
+            while current:
+                self.__track(current)
+                current = current.next
+        self.__head, self.__tail, error = _merge(self.__head, head, key, reverse)
+        self.__finger = None
+        self.__size += count
+        self.shape = tuple([self.__size])
+        self.__relink_prev()
+        if error is not None:
+            raise error
+
+    def reversed_view(self) -> "ReversedView":
+        """
+        Returns a read-only view of the linked list in reverse order.
+
+        The view walks from the tail on demand and reflects later changes to the linked list.
+        """
+        return ReversedView(self)
 
     def reverse(self) -> None:
         """
@@ -607,3 +2137,151 @@ class DoublyLinkedList:
             current = current.prev
         if ptr:
             self.__head = ptr.prev
+        if self.__finger is not None:
+            self.__finger_index = self.__size - 1 - self.__finger_index
+
+    def lazy(self) -> "LazyPipeline":
+        """
+        Returns a lazy pipeline over the elements, e.g. `ll.lazy().map(f).filter(p).take(n).to_singly()`.
+
+        Stages are only evaluated by a terminal operation, which walks the nodes once; see `lazy.LazyPipeline`.
+        """
+        # Imported here as lazy.py builds on this module.
+        from lazy import LazyPipeline
+
+        return LazyPipeline(self)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the elements of the linked list in the chunked binary format of `serialization`.
+
+        Runs of `int` or `float` are stored as packed 64-bit arrays, anything else is pickled.
+        """
+        return serialization.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, indexed: bool = False) -> "DoublyLinkedList":
+        """
+        Returns a new linked list holding the elements serialized in `data` by `to_bytes()`.
+
+        Only load data from trusted sources: non-numeric values are unpickled.
+        """
+        return cls(serialization.loads(data), indexed)
+
+    def dump(self, fileobj) -> None:
+        """
+        Writes the elements of the linked list to a binary file object `fileobj`, one chunk at a time.
+        """
+        serialization.dump(self, fileobj)
+
+    @classmethod
+    def load(cls, fileobj, indexed: bool = False) -> "DoublyLinkedList":
+        """
+        Returns a new linked list holding the elements written by `dump()` to a binary file object `fileobj`.
+
+        Reads one chunk at a time and stops at the end of the dumped elements. Only load data
+        from trusted sources: non-numeric values are unpickled.
+        """
+        return cls(serialization.load(fileobj), indexed)
+
+    def _append_node(self, x) -> Node:
+        """
+        Adds an element `x` at the end of the linked list and returns its node.
+
+        Together with `_unlink_node()` and `_move_node_to_end()` this lets structures built on
+        the linked list, such as `LinkedCache`, keep references to nodes and relink them in O(1).
+        """
+        self.append(x)
+        return self.__tail
+
+    def _unlink_node(self, node: Node) -> None:
+        """
+        Removes a `node` of this linked list in O(1).
+        """
+        self.__finger = None
+        self.__unlink(node)
+
+    def _move_node_to_end(self, node: Node) -> None:
+        """
+        Moves a `node` of this linked list to the end in O(1).
+        """
+        if node is self.__tail:
+            return
+        self.__finger = None
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.__head = node.next
+        node.next.prev = node.prev
+        node.prev = self.__tail
+        node.next = None
+        self.__tail.next = node
+        self.__tail = node
+
+    def to_jsonl(self, path: str) -> None:
+        """
+        Writes the elements of the linked list to the file at `path` as JSON Lines, one chunk at a time.
+        """
+        serialization.dump_jsonl(self, path)
+
+    @classmethod
+    def from_jsonl(cls, path: str, indexed: bool = False) -> "DoublyLinkedList":
+        """
+        Returns a new linked list holding the elements of the JSON Lines file at `path`.
+
+        Reads the file a line at a time, so only the linked list itself grows with its size.
+        """
+        return cls(serialization.load_jsonl(path), indexed)
+
+    def to_csv(self, path: str) -> None:
+        """
+        Writes the elements of the linked list to the file at `path` as CSV rows, one chunk at a time.
+
+        A `list` or `tuple` element becomes a row of its fields, any other element a single-field row.
+        """
+        serialization.dump_csv(self, path)
+
+    @classmethod
+    def from_csv(cls, path: str, indexed: bool = False) -> "DoublyLinkedList":
+        """
+        Returns a new linked list holding the rows of the CSV file at `path`, each as a `list` of strings.
+        """
+        return cls(serialization.load_csv(path), indexed)
+
+
+class ReversedView:
+    """
+    Read-only, reverse-order view of a `DoublyLinkedList`.
+
+    Supports negative indexing; nothing is copied.
+    """
+
+    def __init__(self, linked_list: DoublyLinkedList) -> None:
+        self.__list = linked_list
+
+    def __len__(self) -> int:
+        return len(self.__list)
+
+    def __iter__(self) -> Iterator:
+        return reversed(self.__list)
+
+    def __reversed__(self) -> Iterator:
+        return iter(self.__list)
+
+    def __contains__(self, x) -> bool:
+        return x in self.__list
+
+    def __str__(self) -> str:
+        return _preview(self, len(self))
+
+    def get(self, index: int):
+        """
+        Returns the element at a given `index` of the view, counting from the tail of the linked list.
+
+        Supports negative indexing; raises `IndexError` if `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        return self.__list.get(-1 - index)
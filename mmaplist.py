@@ -0,0 +1,514 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Doubly linked list stored in memory-mapped files.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Doubly linked list stored in memory-mapped files.
+
+The node file starts with a `HEADER` and holds fixed-size `RECORD`s, one per slot. Each record
+has the `next` and `prev` slot numbers and the offset and length of the node's value. The values
+are pickled one after another into an append-only `.values` file next to it.
+"""
+
+# Generic/Built-in
+import mmap
+import os
+import pickle
+import struct
+from typing import Iterable, Iterator, Union
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+# Slot number standing for a missing link.
+NIL = -1
+
+MAGIC = b"PLLNODE1"
+
+# Magic, head, tail, size, free list head, slots ever allocated.
+HEADER = struct.Struct("<8sqqqqq")
+# Next slot, previous slot, value offset, value length.
+RECORD = struct.Struct("<qqQQ")
+
+_LINK = struct.Struct("<q")
+_LINKS = struct.Struct("<qq")
+_VALUE = struct.Struct("<QQ")
+
+# Slots the node file grows to first.
+INITIAL_SLOTS = 1024
+
+
+class FileBackedLinkedList:
+    """
+    Doubly linked list whose nodes live in a memory-mapped file at `path` and whose values
+    live in an append-only file at `path + ".values"`, so it can grow past physical memory.
+
+    Has the same interface and error semantics as `DoublyLinkedList` for `get()`, `index()`,
+    `append()`, `insert()`, `pop()`, `remove()`, iteration and the deque operations. Opening an
+    existing `path` only reads the header; nodes and values are paged in as they are
+    visited. Removed slots go on a free list stored in the node file and are reused by later
+    insertions; the bytes of removed values stay in the value file.
+
+    Changes reach the files through the OS page cache; call `flush()` or `close()`, or use the
+    linked list as a context manager, to write them out. Not safe for concurrent writers.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], x: Iterable = None) -> None:
+        self.__path: str = os.fspath(path)
+        exists = os.path.exists(self.__path) and os.path.getsize(self.__path) > 0
+        mode = "r+b" if exists else "w+b"
+        self.__nodes = open(self.__path, mode)
+        self.__values = None
+        self.__map = None
+        try:
+            if exists:
+                # Check the header before touching the value file, which may not exist.
+                header = self.__nodes.read(HEADER.size)
+                if len(header) < HEADER.size or header[: len(MAGIC)] != MAGIC:
+                    raise ValueError(f"{self.__path} is not a file-backed linked list")
+                self.__values = open(self.__path + ".values", mode)
+                self.__map = mmap.mmap(self.__nodes.fileno(), 0)
+                _, self.__head, self.__tail, self.__size, self.__free, self.__count = (
+                    HEADER.unpack(header)
+                )
+            else:
+                self.__values = open(self.__path + ".values", mode)
+                self.__nodes.truncate(HEADER.size + INITIAL_SLOTS * RECORD.size)
+                self.__map = mmap.mmap(self.__nodes.fileno(), 0)
+                self.__head = self.__tail = self.__free = NIL
+                self.__size = self.__count = 0
+                self.__write_header()
+        except BaseException:
+            for resource in (self.__map, self.__values, self.__nodes):
+                if resource is not None:
+                    resource.close()
+            raise
+        self.__capacity: int = (len(self.__map) - HEADER.size) // RECORD.size
+        self.shape: tuple = tuple([self.__size])
+        # Last slot reached by a positional walk and its index.
+        self.__finger: int = NIL
+        self.__finger_index: int = 0
+        if x:
+            self.extend(x)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, x) -> bool:
+        return any(x == value for value in self)
+
+    def __iter__(self) -> Iterator:
+        slot = self.__head
+        while slot != NIL:
+            following = self.__next(slot)
+            yield self.__value(slot)
+            slot = following
+
+    def __reversed__(self) -> Iterator:
+        slot = self.__tail
+        while slot != NIL:
+            following = self.__prev(slot)
+            yield self.__value(slot)
+            slot = following
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __enter__(self) -> "FileBackedLinkedList":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __write_header(self) -> None:
+        HEADER.pack_into(
+            self.__map,
+            0,
+            MAGIC,
+            self.__head,
+            self.__tail,
+            self.__size,
+            self.__free,
+            self.__count,
+        )
+
+    def __next(self, slot: int) -> int:
+        return _LINK.unpack_from(self.__map, HEADER.size + slot * RECORD.size)[0]
+
+    def __prev(self, slot: int) -> int:
+        return _LINK.unpack_from(self.__map, HEADER.size + slot * RECORD.size + 8)[0]
+
+    def __set_next(self, slot: int, target: int) -> None:
+        _LINK.pack_into(self.__map, HEADER.size + slot * RECORD.size, target)
+
+    def __set_prev(self, slot: int, target: int) -> None:
+        _LINK.pack_into(self.__map, HEADER.size + slot * RECORD.size + 8, target)
+
+    def __value(self, slot: int):
+        offset, length = _VALUE.unpack_from(
+            self.__map, HEADER.size + slot * RECORD.size + 16
+        )
+        self.__values.seek(offset)
+        return pickle.loads(self.__values.read(length))
+
+    def __allocate(self, x) -> int:
+        """
+        Returns a detached slot holding `x`, reusing a freed slot when there is one.
+        """
+        data = pickle.dumps(x, protocol=pickle.HIGHEST_PROTOCOL)
+        offset = self.__values.seek(0, os.SEEK_END)
+        self.__values.write(data)
+        if self.__free != NIL:
+            slot = self.__free
+            self.__free = self.__next(slot)
+        else:
+            if self.__count == self.__capacity:
+                self.__grow()
+            slot = self.__count
+            self.__count += 1
+        RECORD.pack_into(
+            self.__map, HEADER.size + slot * RECORD.size, NIL, NIL, offset, len(data)
+        )
+        return slot
+
+    def __release(self, slot: int) -> None:
+        """
+        Puts a detached `slot` on the free list.
+        """
+        self.__set_next(slot, self.__free)
+        self.__free = slot
+
+    def __grow(self) -> None:
+        """
+        Doubles the number of slots in the node file and maps it again.
+        """
+        self.__capacity *= 2
+        self.__map.close()
+        self.__nodes.truncate(HEADER.size + self.__capacity * RECORD.size)
+        self.__map = mmap.mmap(self.__nodes.fileno(), 0)
+
+    def __slot_at(self, index: int) -> int:
+        """
+        Returns the slot at an in-range, non-negative `index`.
+
+        Walks from whichever of the head, the tail and the finger is closest to `index`.
+        """
+        slot = self.__head
+        count = 0
+        distance = index
+        if self.__size - 1 - index < distance:
+            slot = self.__tail
+            count = self.__size - 1
+            distance = count - index
+        if self.__finger != NIL and abs(index - self.__finger_index) < distance:
+            slot = self.__finger
+            count = self.__finger_index
+        while count < index:
+            slot = self.__next(slot)
+            count += 1
+        while count > index:
+            slot = self.__prev(slot)
+            count -= 1
+        self.__finger = slot
+        self.__finger_index = index
+        return slot
+
+    def __unlink(self, slot: int) -> None:
+        previous, following = self.__prev(slot), self.__next(slot)
+        if previous != NIL:
+            self.__set_next(previous, following)
+        else:
+            self.__head = following
+        if following != NIL:
+            self.__set_prev(following, previous)
+        else:
+            self.__tail = previous
+        self.__release(slot)
+        self.__size -= 1
+        self.shape = tuple([self.__size])
+        self.__write_header()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def size(self) -> int:
+        """
+        Returns the size of the linked list.
+        """
+        return self.__size
+
+    def get(self, index: int):
+        """
+        Returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; raises `IndexError` if `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if abs(index) > self.__size or index >= self.__size:
+            raise IndexError("linked list index out of range")
+        if index < 0:
+            index += self.__size
+        return self.__value(self.__slot_at(index))
+
+    def index(self, x) -> int:
+        """
+        Returns the index of the first occurrence of an element `x` in the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        for index, value in enumerate(self):
+            if x == value:
+                return index
+        raise ValueError(
+            f"{repr(x) if isinstance(x, str) else x} is not in linked list"
+        )
+
+    def append(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list.
+        """
+        slot = self.__allocate(x)
+        if self.__tail == NIL:
+            self.__head = slot
+        else:
+            self.__set_prev(slot, self.__tail)
+            self.__set_next(self.__tail, slot)
+        self.__tail = slot
+        self.__size += 1
+        self.shape = tuple([self.__size])
+        self.__write_header()
+
+    def appendleft(self, x) -> None:
+        """
+        Adds an element `x` at the beginning of the linked list in O(1).
+        """
+        if self.__head == NIL:
+            self.append(x)
+            return
+        slot = self.__allocate(x)
+        self.__set_next(slot, self.__head)
+        self.__set_prev(self.__head, slot)
+        self.__head = slot
+        if self.__finger != NIL:
+            self.__finger_index += 1
+        self.__size += 1
+        self.shape = tuple([self.__size])
+        self.__write_header()
+
+    def insert(self, index: int, x) -> None:
+        """
+        Adds an element `x` at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `insert()` method of list.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0:
+            index = max(index + self.__size, 0)
+        if index >= self.__size:
+            self.append(x)
+            return
+        if index == 0:
+            self.appendleft(x)
+            return
+        current = self.__slot_at(index)
+        slot = self.__allocate(x)
+        previous = self.__prev(current)
+        self.__set_next(slot, current)
+        self.__set_prev(slot, previous)
+        self.__set_next(previous, slot)
+        self.__set_prev(current, slot)
+        self.__finger = slot
+        self.__size += 1
+        self.shape = tuple([self.__size])
+        self.__write_header()
+
+    def pop(self, index: Union[int, None] = None):
+        """
+        Removes and returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `pop()` method of list.
+
+        Raises `IndexError` if `index` is out of range.
+        """
+        if index is not None and not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if self.__head == NIL:
+            raise IndexError("pop from empty linked list")
+        if index is None:
+            index = self.__size - 1
+        elif index < 0:
+            if abs(index) > self.__size:
+                raise IndexError("pop index out of range")
+            index += self.__size
+        elif index >= self.__size:
+            raise IndexError("pop index out of range")
+        slot = self.__slot_at(index)
+        value = self.__value(slot)
+        previous = self.__prev(slot)
+        if previous != NIL:
+            self.__finger = previous
+            self.__finger_index = index - 1
+        else:
+            self.__finger = self.__next(slot)
+        self.__unlink(slot)
+        return value
+
+    def popleft(self):
+        """
+        Removes and returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        return self.pop(0)
+
+    def peekleft(self):
+        """
+        Returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if self.__head == NIL:
+            raise IndexError("peek from empty linked list")
+        return self.__value(self.__head)
+
+    def peek(self):
+        """
+        Returns the last element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if self.__tail == NIL:
+            raise IndexError("peek from empty linked list")
+        return self.__value(self.__tail)
+
+    def count(self, x) -> int:
+        """
+        Returns the number of occurrences of an element `x` in the linked list.
+        """
+        return sum(1 for value in self if x == value)
+
+    def remove(self, x) -> None:
+        """
+        Removes an element `x` from the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        self.pop(self.index(x))
+
+    def extend(self, x: Iterable) -> None:
+        "Adds the element(s) of a linked list or an iterable `x` at the end of an existing linked list."
+        if not isinstance(x, Iterable):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        for element in x:
+            self.append(element)
+
+    def extendleft(self, x: Iterable) -> None:
+        """
+        Adds the element(s) of a linked list or an iterable `x` at the beginning of the linked list, one at a time.
+
+        The added elements end up in reverse order, as with `collections.deque.extendleft()`.
+        """
+        if not isinstance(x, Iterable):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        for element in x:
+            self.appendleft(element)
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the elements in the linked list.
+
+        Swaps the links of every record in place, in O(n) without touching the values.
+        """
+        slot = self.__head
+        while slot != NIL:
+            offset = HEADER.size + slot * RECORD.size
+            following, previous = _LINKS.unpack_from(self.__map, offset)
+            _LINKS.pack_into(self.__map, offset, previous, following)
+            slot = following
+        self.__head, self.__tail = self.__tail, self.__head
+        if self.__finger != NIL:
+            self.__finger_index = self.__size - 1 - self.__finger_index
+        self.__write_header()
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the linked list and truncates the value file.
+        """
+        self.__head = self.__tail = self.__free = NIL
+        self.__size = self.__count = 0
+        self.shape = tuple([self.__size])
+        self.__finger = NIL
+        self.__values.truncate(0)
+        self.__write_header()
+
+    def flush(self) -> None:
+        """
+        Writes pending changes to both files.
+        """
+        self.__values.flush()
+        self.__map.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the files; the linked list can't be used afterwards.
+        """
+        if self.__nodes.closed:
+            return
+        if not self.__map.closed:
+            self.flush()
+            self.__map.close()
+        self.__values.close()
+        self.__nodes.close()
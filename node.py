@@ -52,10 +52,58 @@ __status__ = "Dev"
 
 class Node:
     """
-    Represents the nodes of a linked list.
+    Represents the nodes of a doubly linked list.
     """
 
+    __slots__ = ("prev", "next", "value")
+
     def __init__(self, value) -> None:
         self.prev = None
         self.next = None
         self.value = value
+
+
+class SinglyNode:
+    """
+    Represents the nodes of a singly linked list.
+
+    Carries no `prev` link.
+    """
+
+    __slots__ = ("next", "value")
+
+    def __init__(self, value) -> None:
+        self.next = None
+        self.value = value
+
+
+class SkipNode:
+    """
+    Represents the nodes of an indexable skip list.
+
+    `next[level]` is the forward link at `level` and `width[level]` the number of
+    level-0 steps it spans; `prev` links level 0 backwards.
+    """
+
+    __slots__ = ("prev", "next", "width", "value")
+
+    def __init__(self, value, level: int) -> None:
+        self.prev = None
+        self.next = [None] * level
+        self.width = [1] * level
+        self.value = value
+
+
+class UnrolledNode:
+    """
+    Represents the nodes of an unrolled linked list.
+
+    Each node holds a chunk of up to a fixed number of values.
+    """
+
+    __slots__ = ("prev", "next", "values")
+
+    def __init__(self, values: list) -> None:
+        self.prev = None
+        self.next = None
+        self.values = values
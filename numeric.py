@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Typed numeric linked list with vectorized bulk operations.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Typed numeric linked list with vectorized bulk operations.
+"""
+
+# Generic/Built-in
+import sys
+from array import array
+from itertools import compress, islice
+from typing import Callable, Iterable, Union
+
+# Libs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Owned
+from arena import ArenaLinkedList
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+# Numeric `array` typecodes.
+TYPECODES = "bBhHiIlLqQfd"
+# Buffer format prefixes whose byte order isn't the machine's.
+_FOREIGN_ORDERS = ">!" if sys.byteorder == "little" else "<"
+
+
+class NumericLinkedList(ArenaLinkedList):
+    """
+    Arena linked list whose values live in a contiguous `array` of a numeric `typecode`.
+
+    Keeps the `ArenaLinkedList` interface and adds `sum()`, `min()`, `max()`,
+    `map()`, `filter()`, `to_numpy()` and `from_numpy()`, which run over the
+    value buffer instead of walking the links. Uses NumPy when it is installed.
+
+    While slot `i` holds the element at index `i` the buffer is used as is;
+    otherwise the first bulk operation compacts the slots once in O(n).
+    """
+
+    def __init__(self, x: Iterable = None, typecode: str = "d") -> None:
+        if typecode not in TYPECODES or len(typecode) != 1:
+            raise ValueError(f"typecode must be one of '{TYPECODES}'")
+        self.typecode: str = typecode
+        # True while slot `i` holds the element at index `i`.
+        self._packed: bool = True
+        super().__init__(x)
+
+    def _new_values(self):
+        return array(self.typecode)
+
+    def _release(self, slot: int) -> None:
+        self._values[slot] = 0
+        self._free.append(slot)
+
+    def __track(self) -> None:
+        # A mutation keeps slots in list order only if the tail is still slot `size - 1`.
+        self._packed = self._packed and self._tail == len(self) - 1
+
+    def __buffer(self):
+        """
+        Returns the value buffer with slot `i` holding the element at index `i`.
+
+        Slots past `len(self)` may hold freed values.
+        """
+        if not self._packed:
+            self.compact()
+        return self._values
+
+    def __ndarray(self):
+        if np is None:
+            raise ImportError("NumPy is required for this operation")
+        return np.frombuffer(self.__buffer(), dtype=self.typecode, count=len(self))
+
+    @classmethod
+    def _from_values(cls, values: array) -> "NumericLinkedList":
+        linked_list = cls(typecode=values.typecode)
+        linked_list._adopt(values)
+        return linked_list
+
+    def append(self, x) -> None:
+        super().append(x)
+        self.__track()
+
+    def insert(self, index: int, x) -> None:
+        super().insert(index, x)
+        self.__track()
+
+    def pop(self, index: Union[int, None] = None):
+        value = super().pop(index)
+        self.__track()
+        return value
+
+    def extend(self, x: Iterable) -> None:
+        super().extend(x)
+        self.__track()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__track()
+
+    def _adopt(self, values) -> None:
+        super()._adopt(values)
+        self._packed = True
+
+    def sum(self):
+        """
+        Returns the sum of the elements of the linked list.
+        """
+        if np is not None:
+            return self.__ndarray().sum().item()
+        return sum(islice(self.__buffer(), len(self)))
+
+    def min(self):
+        """
+        Returns the smallest element of the linked list.
+
+        Raises `ValueError` if the linked list is empty.
+        """
+        if not len(self):
+            raise ValueError("min() of empty linked list")
+        if np is not None:
+            return self.__ndarray().min().item()
+        return min(islice(self.__buffer(), len(self)))
+
+    def max(self):
+        """
+        Returns the largest element of the linked list.
+
+        Raises `ValueError` if the linked list is empty.
+        """
+        if not len(self):
+            raise ValueError("max() of empty linked list")
+        if np is not None:
+            return self.__ndarray().max().item()
+        return max(islice(self.__buffer(), len(self)))
+
+    def map(self, func: Callable, typecode: str = None) -> "NumericLinkedList":
+        """
+        Returns a new linked list of `func` applied to every element.
+
+        A NumPy ufunc is applied to the whole buffer at once and the result keeps its dtype;
+        any other callable is applied per element and stored with `typecode`
+        (this list's typecode by default).
+        """
+        if np is not None and isinstance(func, np.ufunc):
+            return type(self).from_numpy(func(self.__ndarray()))
+        values = array(typecode or self.typecode, map(func, self))
+        return type(self)._from_values(values)
+
+    def filter(self, mask: Iterable) -> "NumericLinkedList":
+        """
+        Returns a new linked list of the elements whose entry in `mask` is true.
+
+        Raises `ValueError` if `mask` and the linked list differ in length.
+        """
+        if len(mask) != len(self):
+            raise ValueError("mask length does not match the linked list")
+        if np is not None and isinstance(mask, np.ndarray):
+            return type(self).from_numpy(self.__ndarray()[mask.astype(bool)])
+        values = array(self.typecode, compress(self, mask))
+        return type(self)._from_values(values)
+
+    def to_numpy(self, copy: bool = True):
+        """
+        Returns the elements as a one-dimensional NumPy array.
+
+        With `copy=False` the array shares the value buffer; the linked list cannot
+        grow while such a view is alive.
+        """
+        values = self.__ndarray()
+        return values.copy() if copy else values
+
+    @classmethod
+    def from_numpy(cls, x) -> "NumericLinkedList":
+        """
+        Returns a linked list holding the elements of a one-dimensional array `x`.
+
+        Accepts any object exporting a numeric buffer; the data is copied once. Buffers in the
+        non-native byte order, e.g. a `dtype(">i8")` array on a little-endian machine, are
+        byte-swapped.
+        """
+        if np is not None:
+            x = np.ascontiguousarray(x)
+        view = memoryview(x)
+        typecode = view.format.lstrip("@=<>!")
+        if view.ndim != 1:
+            raise ValueError("from_numpy() expects a one-dimensional array")
+        if typecode not in TYPECODES or len(typecode) != 1:
+            raise TypeError(f"unsupported element type '{view.format}'")
+        values = array(typecode)
+        # "<", ">" and "!" formats have standard sizes, which may differ from the native ones.
+        if values.itemsize != view.itemsize:
+            raise TypeError(f"unsupported element type '{view.format}'")
+        values.frombytes(view.cast("B"))
+        if view.format[0] in _FOREIGN_ORDERS:
+            values.byteswap()
+        return cls._from_values(values)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Persistent (immutable) singly linked list with structural sharing.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Persistent (immutable) singly linked list with structural sharing.
+
+Every operation that would change a `PersistentList` returns a new one instead, sharing the
+unchanged nodes with the original, so older versions stay valid and can be read from any
+thread without locking.
+"""
+
+# Generic/Built-in
+from typing import Iterable, Iterator, Union
+
+# Owned
+from linkedlist import DoublyLinkedList, SinglyLinkedList, _preview
+from node import SinglyNode
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+
+class PersistentList:
+    """
+    Immutable singly linked list whose versions share their common tails.
+
+    `cons()`/`appendleft()`, `tail()` and `snapshot()` are O(1) and allocate at most one node.
+    `insert()` copies only the nodes before the insertion point. Nodes are never modified
+    once the linked list is built.
+
+    Supports negative indexing.
+    """
+
+    def __init__(
+        self,
+        x: Union["PersistentList", SinglyLinkedList, DoublyLinkedList, Iterable] = None,
+    ) -> None:
+        self.__head = None
+        self.__size: int = 0
+        if isinstance(x, PersistentList):
+            # Already immutable, so the nodes can be shared as they are.
+            self.__head = x.__head
+            self.__size = x.__size
+        elif x is not None:
+            last = None
+            for value in x:
+                node = SinglyNode(value)
+                if last is None:
+                    self.__head = node
+                else:
+                    last.next = node
+                last = node
+                self.__size += 1
+
+    @classmethod
+    def __make(cls, head, size: int) -> "PersistentList":
+        """
+        Returns a new linked list over the existing chain starting at `head`.
+        """
+        result = cls.__new__(cls)
+        result.__head = head
+        result.__size = size
+        return result
+
+    @property
+    def shape(self) -> tuple:
+        return tuple([self.__size])
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self) -> Iterator:
+        current = self.__head
+        while current:
+            yield current.value
+            current = current.next
+
+    def __contains__(self, x) -> bool:
+        return any(value is x or value == x for value in self)
+
+    def __getitem__(self, index: int):
+        return self.get(index)
+
+    def __str__(self) -> str:
+        return _preview(self, self.__size)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({_preview(self, self.__size)})"
+
+    def __reduce__(self) -> tuple:
+        # Pickle the values as one flat list rather than recursing through the nodes.
+        return type(self), (list(self),)
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the linked list in O(1).
+        """
+        return self.__size
+
+    def get(self, index: int):
+        """
+        Returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; raises `IndexError` if `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if abs(index) > self.__size or index >= self.__size:
+            raise IndexError("linked list index out of range")
+        if index < 0:
+            index += self.__size
+        current = self.__head
+        for _ in range(index):
+            current = current.next
+        return current.value
+
+    def index(self, x) -> int:
+        """
+        Returns the index of the first occurrence of an element `x` in the linked list.
+
+        Raises `ValueError` if `x` is not in the linked list.
+        """
+        for index, value in enumerate(self):
+            if value is x or value == x:
+                return index
+        raise ValueError(
+            f"{repr(x) if isinstance(x, str) else x} is not in the linked list"
+        )
+
+    def count(self, x) -> int:
+        """
+        Returns the number of occurrences of an element `x` in the linked list.
+        """
+        return sum(1 for value in self if value is x or value == x)
+
+    def peekleft(self):
+        """
+        Returns the first element of the linked list in O(1).
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("peek from empty linked list")
+        return self.__head.value
+
+    def cons(self, x) -> "PersistentList":
+        """
+        Returns a new linked list with an element `x` in front of this one, in O(1).
+
+        The new linked list shares every node of this one.
+        """
+        node = SinglyNode(x)
+        node.next = self.__head
+        return self.__make(node, self.__size + 1)
+
+    def appendleft(self, x) -> "PersistentList":
+        """
+        Same as `cons()`.
+        """
+        return self.cons(x)
+
+    def tail(self) -> "PersistentList":
+        """
+        Returns a new linked list without the first element, in O(1) and sharing every node.
+
+        Raises `IndexError` if the linked list is empty.
+        """
+        if not self.__head:
+            raise IndexError("tail of empty linked list")
+        return self.__make(self.__head.next, self.__size - 1)
+
+    def insert(self, index: int, x) -> "PersistentList":
+        """
+        Returns a new linked list with an element `x` added at a given `index`.
+
+        Copies the `index` nodes in front of the insertion point and shares the rest.
+        Supports negative indexing; clamps an out-of-range `index` like `list.insert()`.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0:
+            index = max(index + self.__size, 0)
+        index = min(index, self.__size)
+        head = last = None
+        current = self.__head
+        for _ in range(index):
+            node = SinglyNode(current.value)
+            if last is None:
+                head = node
+            else:
+                last.next = node
+            last = node
+            current = current.next
+        node = SinglyNode(x)
+        node.next = current
+        if last is None:
+            head = node
+        else:
+            last.next = node
+        return self.__make(head, self.__size + 1)
+
+    def snapshot(self) -> "PersistentList":
+        """
+        Returns a point-in-time view of the linked list in O(1).
+
+        A persistent linked list never changes, so the view is the linked list itself.
+        """
+        return self
+
+    def to_singly(self, indexed: bool = False) -> SinglyLinkedList:
+        """
+        Returns a new `SinglyLinkedList` holding the elements of the linked list.
+        """
+        return SinglyLinkedList(self, indexed)
+
+    def to_doubly(self, indexed: bool = False) -> DoublyLinkedList:
+        """
+        Returns a new `DoublyLinkedList` holding the elements of the linked list.
+        """
+        return DoublyLinkedList(self, indexed)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Chunked binary serialization of linked list values.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Chunked binary serialization of linked list values.
+
+A stream starts with `MAGIC` and holds chunks of up to `CHUNK_SIZE` values, each a
+`<tag, count, length>` header followed by `length` bytes of payload, and ends with an
+`END` chunk:
+
+- `INT64` (`b"q"`): the values are all `int` within 64 bits, stored as little-endian int64;
+- `FLOAT64` (`b"d"`): the values are all `float`, stored as little-endian IEEE 754 doubles;
+- `PICKLE` (`b"p"`): anything else, stored as a pickled `list`.
+
+Values are read and written one chunk at a time, so memory stays bounded and size and time
+grow linearly with the number of values. Loading a `PICKLE` chunk can run arbitrary code:
+only load streams from trusted sources.
+
+`dump_jsonl()`/`load_jsonl()` and `dump_csv()`/`load_csv()` stream values to and from
+JSON Lines and CSV text files in the same way, one chunk of values at a time.
+"""
+
+# Generic/Built-in
+import csv
+import io
+import json
+import pickle
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+MAGIC = b"PLL\x01"
+CHUNK_SIZE = 65536
+
+INT64 = b"q"
+FLOAT64 = b"d"
+PICKLE = b"p"
+END = b"e"
+
+# Tag, number of values, payload length in bytes.
+_HEADER = struct.Struct("<cIQ")
+
+
+def _encode(values: list) -> tuple:
+    """
+    Returns the tag and payload of a chunk holding `values`.
+    """
+    kinds = set(map(type, values))
+    if kinds == {int} or kinds == {float}:
+        try:
+            typed = array("q" if int in kinds else "d", values)
+        except OverflowError:
+            pass
+        else:
+            if sys.byteorder == "big":
+                typed.byteswap()
+            return (INT64 if int in kinds else FLOAT64), typed.tobytes()
+    return PICKLE, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(tag: bytes, payload: bytes) -> list:
+    if tag == PICKLE:
+        return pickle.loads(payload)
+    if tag != INT64 and tag != FLOAT64:
+        raise ValueError(f"unknown chunk tag {tag!r}")
+    typed = array(tag.decode())
+    typed.frombytes(payload)
+    if sys.byteorder == "big":
+        typed.byteswap()
+    return typed.tolist()
+
+
+def _read(fileobj: BinaryIO, size: int) -> bytes:
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise ValueError("truncated linked list data")
+    return data
+
+
+def _chunks(values: Iterable, chunk_size: int) -> Iterator:
+    """
+    Returns an iterator over the elements of an iterable `values` in lists of up to
+    `chunk_size` elements.
+    """
+    if not isinstance(chunk_size, int):
+        raise TypeError(
+            f"'{type(chunk_size).__name__}' object cannot be interpreted as an integer"
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    iterator = iter(values)
+    return iter(lambda: list(islice(iterator, chunk_size)), [])
+
+
+def dump(values: Iterable, fileobj: BinaryIO, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Writes the elements of an iterable `values` to a binary file object `fileobj`.
+    """
+    chunks = _chunks(values, chunk_size)
+    fileobj.write(MAGIC)
+    for chunk in chunks:
+        tag, payload = _encode(chunk)
+        fileobj.write(_HEADER.pack(tag, len(chunk), len(payload)))
+        fileobj.write(payload)
+    fileobj.write(_HEADER.pack(END, 0, 0))
+
+
+def load(fileobj: BinaryIO) -> Iterator:
+    """
+    Yields the elements written by `dump()` to a binary file object `fileobj`, one chunk at a time.
+
+    Reads up to the end of the stream and no further; raises `ValueError` for malformed data.
+    """
+    if _read(fileobj, len(MAGIC)) != MAGIC:
+        raise ValueError("not a serialized linked list")
+    while True:
+        tag, count, length = _HEADER.unpack(_read(fileobj, _HEADER.size))
+        if tag == END:
+            return
+        values = _decode(tag, _read(fileobj, length))
+        if len(values) != count:
+            raise ValueError("corrupt linked list chunk")
+        yield from values
+
+
+def dumps(values: Iterable, chunk_size: int = CHUNK_SIZE) -> bytes:
+    """
+    Returns the elements of an iterable `values` in the format of `dump()`.
+    """
+    buffer = io.BytesIO()
+    dump(values, buffer, chunk_size)
+    return buffer.getvalue()
+
+
+def loads(data: bytes) -> Iterator:
+    """
+    Yields the elements serialized in `data` by `dumps()`.
+    """
+    return load(io.BytesIO(data))
+
+
+def dump_jsonl(values: Iterable, path: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Writes the elements of an iterable `values` to the file at `path` as JSON Lines, one
+    JSON document per line.
+
+    Raises `TypeError` for a value JSON can't encode.
+    """
+    chunks = _chunks(values, chunk_size)
+    encode = json.JSONEncoder().encode
+    with open(path, "w", encoding="utf-8") as fileobj:
+        for chunk in chunks:
+            fileobj.write("\n".join(map(encode, chunk)))
+            fileobj.write("\n")
+
+
+def load_jsonl(path: str) -> Iterator:
+    """
+    Yields the elements decoded from the JSON Lines file at `path`, skipping blank lines.
+
+    Raises `ValueError` for a line that isn't valid JSON.
+    """
+    with open(path, encoding="utf-8") as fileobj:
+        for line in fileobj:
+            if line.strip():
+                yield json.loads(line)
+
+
+def dump_csv(values: Iterable, path: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Writes the elements of an iterable `values` to the file at `path` as CSV, one row per
+    element.
+
+    A `list` or `tuple` element is written as a row of its fields, any other element as a
+    row with a single field.
+    """
+    chunks = _chunks(values, chunk_size)
+    with open(path, "w", encoding="utf-8", newline="") as fileobj:
+        writer = csv.writer(fileobj)
+        for chunk in chunks:
+            writer.writerows(
+                [
+                    value if isinstance(value, (list, tuple)) else [value]
+                    for value in chunk
+                ]
+            )
+
+
+def load_csv(path: str) -> Iterator:
+    """
+    Yields the rows of the CSV file at `path`, each as a `list` of strings.
+    """
+    with open(path, encoding="utf-8", newline="") as fileobj:
+        yield from csv.reader(fileobj)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Indexable skip list with logarithmic positional access.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Indexable skip list with logarithmic positional access.
+"""
+
+# Generic/Built-in
+from random import random
+from typing import Iterable, Iterator, Union
+
+# Owned
+from node import SkipNode
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+MAX_LEVEL = 32
+
+
+class IndexableSkipList:
+    """
+    Positional sequence backed by a skip list whose links carry span counts.
+
+    Has the same interface as `DoublyLinkedList`, including negative indexing,
+    but `get()`, `insert()` and `pop()` run in expected O(log n).
+    """
+
+    def __init__(self, x: Iterable = None) -> None:
+        self.__size: int = 0
+        self.shape: tuple = tuple([self.__size])
+        # Sentinel before the first element; position 0, elements occupy 1..size.
+        self.__head = SkipNode(None, MAX_LEVEL)
+        self.__tail = None
+        self.__level: int = 1
+        if x:
+            self.extend(x)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self) -> Iterator:
+        current = self.__head.next[0]
+        while current:
+            yield current.value
+            current = current.next[0]
+
+    def __reversed__(self) -> Iterator:
+        current = self.__tail
+        while current:
+            yield current.value
+            current = current.prev
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __reduce__(self) -> tuple:
+        # Pickle the values as one flat list rather than recursing through the nodes.
+        return type(self), (list(self),)
+
+    @staticmethod
+    def __random_level() -> int:
+        level = 1
+        while level < MAX_LEVEL and random() < 0.5:
+            level += 1
+        return level
+
+    def __trace(self, position: int, level: int) -> tuple:
+        """
+        Returns, for each of the lowest `level` levels, the last node before `position`
+        and that node's position.
+
+        Levels above the ones in use are started at the head and spanning to the end.
+        """
+        for i in range(self.__level, level):
+            self.__head.next[i] = None
+            self.__head.width[i] = self.__size + 1
+        if level > self.__level:
+            self.__level = level
+        update = [self.__head] * self.__level
+        positions = [0] * self.__level
+        current = self.__head
+        pos = 0
+        for i in range(self.__level - 1, -1, -1):
+            while pos + current.width[i] < position:
+                pos += current.width[i]
+                current = current.next[i]
+            update[i] = current
+            positions[i] = pos
+        return update, positions
+
+    def __normalize(self, index: int, message: str) -> int:
+        if abs(index) > self.__size or index >= self.__size:
+            raise IndexError(message)
+        return index + self.__size if index < 0 else index
+
+    def size(self) -> int:
+        """
+        Returns the size of the linked list.
+        """
+        return self.__size
+
+    def get(self, index: int):
+        """
+        Returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; raises `IndexError` if `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        target = self.__normalize(index, "linked list index out of range") + 1
+        current = self.__head
+        pos = 0
+        for i in range(self.__level - 1, -1, -1):
+            while pos + current.width[i] <= target:
+                pos += current.width[i]
+                current = current.next[i]
+        return current.value
+
+    def index(self, x) -> int:
+        """
+        Returns the index of the first occurrence of an element `x` in the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        for index, value in enumerate(self):
+            if x == value:
+                return index
+        raise ValueError(
+            f"{repr(x) if isinstance(x, str) else x} is not in linked list"
+        )
+
+    def append(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list.
+        """
+        self.insert(self.__size, x)
+
+    def insert(self, index: int, x) -> None:
+        """
+        Adds an element `x` at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `insert()` method of list.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0:
+            index = max(index + self.__size, 0)
+        position = min(index, self.__size) + 1
+        level = self.__random_level()
+        update, positions = self.__trace(position, level)
+        node = SkipNode(x, level)
+        for i in range(level):
+            previous = update[i]
+            node.next[i] = previous.next[i]
+            node.width[i] = positions[i] + previous.width[i] - position + 1
+            previous.next[i] = node
+            previous.width[i] = position - positions[i]
+        for i in range(level, self.__level):
+            update[i].width[i] += 1
+        if update[0] is not self.__head:
+            node.prev = update[0]
+        if node.next[0]:
+            node.next[0].prev = node
+        else:
+            self.__tail = node
+        self.__size += 1
+        self.shape = tuple([self.__size])
+
+    def pop(self, index: Union[int, None] = None):
+        """
+        Removes and returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `pop()` method of list.
+
+        Raises `IndexError` if `index` is out of range.
+        """
+        if index is not None and not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if not self.__size:
+            raise IndexError("pop from empty linked list")
+        if index is None:
+            index = self.__size - 1
+        position = self.__normalize(index, "pop index out of range") + 1
+        update, positions = self.__trace(position, 1)
+        node = update[0].next[0]
+        level = len(node.next)
+        for i in range(level):
+            update[i].next[i] = node.next[i]
+            update[i].width[i] += node.width[i] - 1
+        for i in range(level, self.__level):
+            update[i].width[i] -= 1
+        if node.next[0]:
+            node.next[0].prev = node.prev
+        else:
+            self.__tail = node.prev
+        self.__size -= 1
+        self.shape = tuple([self.__size])
+        return node.value
+
+    def remove(self, x) -> None:
+        """
+        Removes an element `x` from the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        self.pop(self.index(x))
+
+    def extend(self, x: Iterable) -> None:
+        "Adds the element(s) of a linked list or an iterable `x` at the end of an existing linked list."
+        if not isinstance(x, Iterable):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        # Links are appended level by level in one pass; spans to the end are fixed up afterwards.
+        update, positions = self.__trace(self.__size + 1, self.__level)
+        position = self.__size
+        for element in x:
+            position += 1
+            level = self.__random_level()
+            for i in range(self.__level, level):
+                self.__head.next[i] = None
+                update.append(self.__head)
+                positions.append(0)
+            if level > self.__level:
+                self.__level = level
+            node = SkipNode(element, level)
+            for i in range(level):
+                update[i].next[i] = node
+                update[i].width[i] = position - positions[i]
+                update[i] = node
+                positions[i] = position
+            node.prev = self.__tail
+            self.__tail = node
+        for i in range(self.__level):
+            update[i].width[i] = position + 1 - positions[i]
+        self.__size = position
+        self.shape = tuple([self.__size])
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the elements in the linked list.
+        """
+        _list = list(reversed(self))
+        self.__head = SkipNode(None, MAX_LEVEL)
+        self.__tail = None
+        self.__level = 1
+        self.__size = 0
+        self.extend(_list)
@@ -1,4 +1,22 @@
+import asyncio
+import ctypes
+import io
+import os
+import pickle
+import tempfile
+from threading import Thread
+
+import instrument
+from arena import ArenaLinkedList
+from asyncqueue import AsyncLinkedList
+from cache import LinkedCache
+from concurrentlist import ConcurrentLinkedList
 from linkedlist import DoublyLinkedList, SinglyLinkedList
+from mmaplist import FileBackedLinkedList
+from numeric import NumericLinkedList
+from persistent import PersistentList
+from skiplist import IndexableSkipList
+from unrolled import UnrolledLinkedList
 
 
 def singlyLinkedList_test() -> None:
@@ -47,6 +65,72 @@ def singlyLinkedList_test() -> None:
     print(f"linked list: {linked_list}, size: {linked_list.size()}")
     linked_list.extend("linkedlist")
     print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"iterated: {[element for element in linked_list]}")
+    print(f"reversed: {list(reversed(linked_list))}")
+    indexed = SinglyLinkedList(linked_list, indexed=True)
+    print(f"count: {indexed.count('l')}, contains: {'python' in indexed}")
+    indexed.remove("l")
+    print(f"linked list: {indexed}, index: {indexed.index('l')}")
+    queue = SinglyLinkedList()
+    queue.append("a")
+    queue.appendleft("b")
+    queue.extendleft(["c", "d"])
+    print(f"queue: {queue}, peekleft: {queue.peekleft()}, peek: {queue.peek()}")
+    print(f"popleft: {queue.popleft()}, pop: {queue.pop()}, queue: {queue}")
+    stack = SinglyLinkedList(range(1000), stack=True)
+    stack.append("top")
+    print(f"stack peek: {stack.peek()}, pop: {stack.pop()}, first: {stack.get(0)}")
+    while stack:
+        stack.pop()
+    assert stack.size() == 0
+    shards = SinglyLinkedList(range(5))
+    shards.concat(SinglyLinkedList(range(5, 8)))
+    shards.splice(SinglyLinkedList(["x", "y"]), 2)
+    tail = shards.split_at(6)
+    print(f"shards: {shards}, size: {shards.size()}, tail: {tail}, size: {tail.size()}")
+    words = SinglyLinkedList(["python", "linked", "list", "node", "sort"])
+    words.sort(key=len)
+    print(f"sorted: {words}")
+    words.sort(reverse=True)
+    words.merge(SinglyLinkedList(["zip", "map", "all"]), reverse=True)
+    print(f"merged: {words}, size: {words.size()}")
+    numbers = SinglyLinkedList([1, 2, 4])
+    try:
+        numbers.merge(SinglyLinkedList([0, 3, 5]), key=lambda x: x if x != 3 else 1 / 0)
+    except ZeroDivisionError as error:
+        print(f"merge key raised: {error}, kept: {numbers}, size: {numbers.size()}")
+    assert sorted(numbers) == [0, 1, 2, 3, 4, 5] and len(numbers) == 6
+    handles = SinglyLinkedList(["a", "c"])
+    handle = handles.insert(1, "b", handle=True)
+    handles.insert_after(handle, "b2")
+    print(f"handles: {handles}, value: {handle.value}")
+    saved = SinglyLinkedList([1, 2.5, "three", None])
+    stream = io.BytesIO()
+    saved.dump(stream)
+    stream.seek(0)
+    print(
+        f"pickled: {pickle.loads(pickle.dumps(saved))}, bytes: {SinglyLinkedList.from_bytes(saved.to_bytes())}, loaded: {SinglyLinkedList.load(stream)}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        saved.to_jsonl(os.path.join(directory, "saved.jsonl"))
+        saved.to_csv(os.path.join(directory, "saved.csv"))
+        print(
+            f"jsonl: {SinglyLinkedList.from_jsonl(os.path.join(directory, 'saved.jsonl'))}, csv: {SinglyLinkedList.from_csv(os.path.join(directory, 'saved.csv'))}"
+        )
+    print(f"truncated: {str(SinglyLinkedList(range(1000)))[-30:]}")
+    pipeline = SinglyLinkedList(range(10)).lazy().map(lambda x: x * x)
+    print(
+        f"lazy: {pipeline.filter(lambda x: x % 2).take(3).to_singly()}, count: {pipeline.count()}, sum: {pipeline.reduce(lambda x, y: x + y)}"
+    )
+    batch = SinglyLinkedList(range(10))
+    batch.insert_many([(8, "x"), (0, "y"), (8, "z")])
+    print(f"get_many: {batch.get_many([9, 0, 4])}, pop_many: {batch.pop_many([1, 0])}")
+    print(f"linked list: {batch}, size: {batch.size()}")
+    digits = SinglyLinkedList(range(10))
+    digits[2:5] = ["a", "b"]
+    digits[6] = "c"
+    del digits[::3]
+    print(f"sliced: {digits}, size: {digits.size()}, every other: {digits[::2]}")
 
 
 def doublyLinkedList_test() -> None:
@@ -95,14 +179,285 @@ def doublyLinkedList_test() -> None:
     print(f"linked list: {linked_list}, size: {linked_list.size()}")
     linked_list.extend("linkedlist")
     print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"iterated: {[element for element in linked_list]}")
+    print(f"reversed: {list(reversed(linked_list))}")
+    indexed = DoublyLinkedList(linked_list, indexed=True)
+    print(f"count: {indexed.count('l')}, contains: {'python' in indexed}")
+    indexed.remove("l")
+    print(f"linked list: {indexed}, index: {indexed.index('l')}")
+    queue = DoublyLinkedList()
+    queue.append("a")
+    queue.appendleft("b")
+    queue.extendleft(["c", "d"])
+    print(f"queue: {queue}, peekleft: {queue.peekleft()}, peek: {queue.peek()}")
+    print(f"popleft: {queue.popleft()}, pop: {queue.pop()}, queue: {queue}")
+    shards = DoublyLinkedList(range(5))
+    shards.concat(DoublyLinkedList(range(5, 8)))
+    shards.splice(DoublyLinkedList(["x", "y"]), 2)
+    tail = shards.split_at(6)
+    print(f"shards: {shards}, size: {shards.size()}, tail: {tail}, size: {tail.size()}")
+    words = DoublyLinkedList(["python", "linked", "list", "node", "sort"])
+    words.sort(key=len)
+    print(f"sorted: {words}")
+    words.sort(reverse=True)
+    words.merge(DoublyLinkedList(["zip", "map", "all"]), reverse=True)
+    print(f"merged: {words}, size: {words.size()}")
+    numbers = DoublyLinkedList([1, 2, 4])
+    try:
+        numbers.merge(DoublyLinkedList([0, 3, 5]), key=lambda x: x if x != 3 else 1 / 0)
+    except ZeroDivisionError as error:
+        print(f"merge key raised: {error}, kept: {numbers}, size: {numbers.size()}")
+    assert sorted(numbers) == [0, 1, 2, 3, 4, 5] and len(numbers) == 6
+    handles = DoublyLinkedList(["a", "c"])
+    handle = handles.append("d", handle=True)
+    first = handles.insert_before(handle, "b")
+    handles.insert_after(first, "b2")
+    handles.move_to_end(first)
+    print(f"handles: {handles}, removed: {handles.remove_node(handle)}, {handles}")
+    try:
+        handles.remove_node(handle)
+    except ValueError as error:
+        print(f"stale handle: {error}")
+    saved = DoublyLinkedList([1, 2.5, "three", None])
+    stream = io.BytesIO()
+    saved.dump(stream)
+    stream.seek(0)
+    print(
+        f"pickled: {pickle.loads(pickle.dumps(saved))}, bytes: {DoublyLinkedList.from_bytes(saved.to_bytes())}, loaded: {DoublyLinkedList.load(stream)}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        saved.to_jsonl(os.path.join(directory, "saved.jsonl"))
+        saved.to_csv(os.path.join(directory, "saved.csv"))
+        print(
+            f"jsonl: {DoublyLinkedList.from_jsonl(os.path.join(directory, 'saved.jsonl'))}, csv: {DoublyLinkedList.from_csv(os.path.join(directory, 'saved.csv'))}"
+        )
+    print(f"truncated: {str(DoublyLinkedList(range(1000)))[-30:]}")
+    pipeline = DoublyLinkedList(range(10)).lazy().map(lambda x: x * x)
+    print(
+        f"lazy: {pipeline.filter(lambda x: x % 2).take(3).to_singly()}, count: {pipeline.count()}, sum: {pipeline.reduce(lambda x, y: x + y)}"
+    )
+    batch = DoublyLinkedList(range(10))
+    batch.insert_many([(8, "x"), (0, "y"), (8, "z")])
+    print(f"get_many: {batch.get_many([9, 0, 4])}, pop_many: {batch.pop_many([1, 0])}")
+    print(f"linked list: {batch}, size: {batch.size()}")
+    digits = DoublyLinkedList(range(10))
+    digits[2:5] = ["a", "b"]
+    digits[-3] = "c"
+    del digits[::3]
+    print(f"sliced: {digits}, size: {digits.size()}, every other: {digits[::-2]}")
     print("without negative indexing")
     for i in range(len(linked_list)):
         print(linked_list.get(i))
     print("with negative indexing")
     for i in range(len(linked_list) - 1, -1, -1):
         print(linked_list.get(i))
+    view = linked_list.reversed_view()
+    print(
+        f"reversed view: {view}, size: {len(view)}, get: {view.get(0)}, {view.get(-1)}"
+    )
+
+
+def indexableSkipList_test() -> None:
+    linked_list = IndexableSkipList(DoublyLinkedList(range(10)))
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    linked_list.insert(3, "programming")
+    linked_list.insert(-2, "python")
+    linked_list.append(1000)
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"get: {linked_list.get(3)}, {linked_list.get(-1)}")
+    print(f"popped: {linked_list.pop(0)}, {linked_list.pop(-3)}, {linked_list.pop()}")
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    linked_list.remove("programming")
+    linked_list.extend(SinglyLinkedList(["A", "B", "C"]))
+    linked_list.reverse()
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"index: {linked_list.index('B')}")
+    print(f"reversed: {list(reversed(linked_list))}")
+
+
+def unrolledLinkedList_test() -> None:
+    linked_list = UnrolledLinkedList(SinglyLinkedList(range(10)), capacity=4)
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    linked_list.insert(2, "programming")
+    linked_list.insert(-1, "python")
+    linked_list.append(1000)
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"get: {linked_list.get(2)}, {linked_list.get(-2)}")
+    print(f"popped: {linked_list.pop(0)}, {linked_list.pop(-4)}, {linked_list.pop()}")
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    linked_list.remove("python")
+    linked_list.extend(DoublyLinkedList(["A", "B", "C"]))
+    linked_list.reverse()
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"index: {linked_list.index('programming')}")
+    print(f"reversed: {list(reversed(linked_list))}")
+
+
+def arenaLinkedList_test() -> None:
+    linked_list = ArenaLinkedList(DoublyLinkedList(range(10)))
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"popped: {linked_list.pop(0)}, {linked_list.pop(-3)}, {linked_list.pop()}")
+    linked_list.insert(2, "programming")
+    linked_list.insert(-1, "python")
+    linked_list.append(1000)
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"get: {linked_list.get(2)}, {linked_list.get(-2)}")
+    linked_list.remove("python")
+    linked_list.extend(SinglyLinkedList(["A", "B", "C"]))
+    linked_list.reverse()
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(f"index: {linked_list.index('programming')}")
+    print(f"reversed: {list(reversed(linked_list))}")
+
+
+def numericLinkedList_test() -> None:
+    linked_list = NumericLinkedList(SinglyLinkedList(range(10)), typecode="q")
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    linked_list.insert(3, 100)
+    print(f"popped: {linked_list.pop(0)}")
+    print(f"linked list: {linked_list}, size: {linked_list.size()}")
+    print(
+        f"sum: {linked_list.sum()}, min: {linked_list.min()}, max: {linked_list.max()}"
+    )
+    print(f"map: {linked_list.map(lambda x: x * 0.5, typecode='d')}")
+    print(f"filter: {linked_list.filter([x % 2 == 0 for x in linked_list])}")
+    big_endian = (ctypes.c_int64.__ctype_be__ * 3)(1, 2, -300)
+    print(f"from_numpy: {NumericLinkedList.from_numpy(big_endian)}")
+    assert list(NumericLinkedList.from_numpy(big_endian)) == [1, 2, -300]
+
+
+def concurrentLinkedList_test() -> None:
+    linked_list = ConcurrentLinkedList(range(3))
+    producers = [
+        Thread(target=linked_list.extend, args=(range(i * 100, i * 100 + 100),))
+        for i in range(1, 4)
+    ]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    print(f"size: {linked_list.size()}, peekleft: {linked_list.peekleft()}")
+    popped = [linked_list.popleft() for _ in range(linked_list.size())]
+    print(f"popped: {len(popped)}, sum: {sum(popped)}, size: {linked_list.size()}")
+    try:
+        linked_list.popleft(timeout=0.01)
+    except IndexError as error:
+        print(f"timed out: {error}")
+
+
+def asyncLinkedList_test() -> None:
+    async def run() -> None:
+        linked_list = AsyncLinkedList(maxsize=4)
+
+        async def produce() -> None:
+            for i in range(10):
+                await linked_list.append(i)
+
+        producer = asyncio.create_task(produce())
+        print(f"popleft: {await linked_list.popleft()}, pop: {await linked_list.pop()}")
+        drained = []
+        while len(drained) < 8:
+            drained.extend(await linked_list.drain(3))
+        await producer
+        print(f"drained: {drained}, size: {linked_list.size()}")
+        try:
+            await linked_list.drain(0)
+        except ValueError as error:
+            print(f"drain(0): {error}")
+        batch = asyncio.create_task(linked_list.drain(1))
+        waiting = asyncio.create_task(linked_list.popleft())
+        await asyncio.sleep(0)
+        linked_list.append_nowait("a")
+        linked_list.append_nowait("b")
+        print(f"drain(1): {await batch}, popleft: {await asyncio.wait_for(waiting, 1)}")
+
+    asyncio.run(run())
+
+
+def linkedCache_test() -> None:
+    for policy in ("lru", "lfu"):
+        evicted = []
+        cache = LinkedCache(3, policy, on_evict=lambda key, value: evicted.append(key))
+        for key in "abcab":
+            cache.put(key, key.upper())
+        cache.get("c")
+        cache.put("d", "D")
+        cache.put("e", "E")
+        print(f"{policy}: {cache}, evicted: {evicted}, missing: {cache.get('z')}")
+        print(f"stats: {cache.stats()}")
+
+
+def fileBackedLinkedList_test() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "linked_list")
+        with FileBackedLinkedList(path, range(5)) as linked_list:
+            linked_list.insert(2, "programming")
+            linked_list.append({"a": 100})
+            print(f"popped: {linked_list.pop(0)}, {linked_list.pop(-2)}")
+        with FileBackedLinkedList(path) as linked_list:
+            print(f"reopened: {linked_list}, size: {linked_list.size()}")
+            print(f"get: {linked_list.get(1)}, index: {linked_list.index(3)}")
+        with open(os.path.join(directory, "other"), "wb") as other:
+            other.write(b"PLL")
+        try:
+            FileBackedLinkedList(os.path.join(directory, "other"))
+        except ValueError as error:
+            print(f"not a linked list: {os.path.basename(str(error))}")
+
+
+def instrument_test() -> None:
+    linked_list = DoublyLinkedList(range(100))
+    profile = instrument.instrument(linked_list)
+    linked_list.get(40)
+    linked_list.insert(90, "programming")
+    linked_list.index(99)
+    for operation, stats in profile.stats().items():
+        print(
+            f"{operation}: calls={stats.calls}, hops={stats.hops}, allocations={stats.allocations}"
+        )
+    linked_list.get_many([10, 50, 80])
+    linked_list.count(5)
+    stats = profile.stats()
+    print(f"get_many hops: {stats['get_many'].hops}, count hops: {stats['count'].hops}")
+    assert stats["get_many"].hops == 80 and stats["count"].hops == 101
+    instrument.uninstrument(linked_list)
+    print(f"uninstrumented: {type(linked_list).__name__}")
+    slices = SinglyLinkedList()
+    profile = instrument.instrument(slices)
+    slices[0:5] = list("abcde")
+    slices[2:4] = list("xyzw")
+    slices[0:2] = list("AB")
+    slices.append("stack")
+    print(
+        f"slices: {slices}, allocations: {profile.stats()['__setitem__'].allocations}"
+    )
+    assert profile.stats()["__setitem__"].allocations == 11
+    assert profile.stats()["append"].allocations == 1
+
+
+def persistentList_test() -> None:
+    linked_list = PersistentList(SinglyLinkedList(["b", "c"]))
+    snapshot = linked_list.snapshot()
+    linked_list = linked_list.cons("a").insert(2, "programming")
+    print(
+        f"persistent: {linked_list}, snapshot: {snapshot}, size: {linked_list.size()}"
+    )
+    print(
+        f"tail: {linked_list.tail()}, get: {linked_list.get(-1)}, peekleft: {linked_list.peekleft()}"
+    )
+    print(f"singly: {linked_list.to_singly()}, doubly: {linked_list.to_doubly()}")
 
 
 if __name__ == "__main__":
     singlyLinkedList_test()
     doublyLinkedList_test()
+    indexableSkipList_test()
+    unrolledLinkedList_test()
+    arenaLinkedList_test()
+    numericLinkedList_test()
+    concurrentLinkedList_test()
+    asyncLinkedList_test()
+    linkedCache_test()
+    fileBackedLinkedList_test()
+    instrument_test()
+    persistentList_test()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Unrolled linked list storing a chunk of values per node.
+################################################################################
+# MIT License
+
+# Copyright (c) 2024 Shatanik Mukherjee
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+################################################################################
+# Author: Shatanik Mukherjee
+# Copyright: Copyright (c) 2024
+# Credits: [Shatanik Mukherjee]
+# License: MIT License
+# Version: 1.0.1
+# Maintainer: Shatanik Mukherjee
+# Email: shatanikmukherjee171@gmail.com
+# Status: Dev
+################################################################################
+
+"""
+Unrolled linked list storing a chunk of values per node.
+"""
+
+# Generic/Built-in
+from itertools import islice
+from typing import Iterable, Iterator, Union
+
+# Owned
+from node import UnrolledNode
+
+__author__ = "Shatanik Mukherjee"
+__copyright__ = "Copyright (c) 2024"
+__credits__ = ["Shatanik Mukherjee"]
+__license__ = "MIT License"
+__version__ = "1.0.1"
+__maintainer__ = "Shatanik Mukherjee"
+__email__ = "shatanikmukherjee171@gmail.com"
+__status__ = "Dev"
+
+
+class UnrolledLinkedList:
+    """
+    Doubly linked list of fixed-capacity chunks.
+
+    Has the same interface as `DoublyLinkedList`, including negative indexing.
+    Full chunks split in half on insert and sparse chunks merge with their
+    successor on pop, so scans touch one node per `capacity` elements.
+    """
+
+    def __init__(self, x: Iterable = None, capacity: int = 64) -> None:
+        if not isinstance(capacity, int):
+            raise TypeError(
+                f"'{type(capacity).__name__}' object cannot be interpreted as an integer"
+            )
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity: int = capacity
+        self.__size: int = 0
+        self.shape: tuple = tuple([self.__size])
+        self.__head = None
+        self.__tail = None
+        if x:
+            self.extend(x)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __iter__(self) -> Iterator:
+        current = self.__head
+        while current:
+            yield from current.values
+            current = current.next
+
+    def __reversed__(self) -> Iterator:
+        current = self.__tail
+        while current:
+            yield from reversed(current.values)
+            current = current.prev
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __reduce__(self) -> tuple:
+        # Pickle the values as one flat list rather than the linked chunks.
+        return type(self), (list(self), self.capacity)
+
+    def __locate(self, index: int) -> tuple:
+        """
+        Returns the chunk holding an in-range, non-negative `index` and the offset within it.
+
+        Walks chunks from whichever end is closer.
+        """
+        if index < self.__size // 2:
+            current = self.__head
+            while index >= len(current.values):
+                index -= len(current.values)
+                current = current.next
+            return current, index
+        index -= self.__size
+        current = self.__tail
+        while -index > len(current.values):
+            index += len(current.values)
+            current = current.prev
+        return current, len(current.values) + index
+
+    def __link_after(self, current, node) -> None:
+        node.prev = current
+        node.next = current.next
+        if current.next:
+            current.next.prev = node
+        else:
+            self.__tail = node
+        current.next = node
+
+    def __unlink(self, node) -> None:
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.__head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.__tail = node.prev
+
+    def size(self) -> int:
+        """
+        Returns the size of the linked list.
+        """
+        return self.__size
+
+    def get(self, index: int):
+        """
+        Returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; raises `IndexError` if `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if abs(index) > self.__size or index >= self.__size:
+            raise IndexError("linked list index out of range")
+        if index < 0:
+            index += self.__size
+        current, offset = self.__locate(index)
+        return current.values[offset]
+
+    def index(self, x) -> int:
+        """
+        Returns the index of the first occurrence of an element `x` in the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        index = 0
+        current = self.__head
+        while current:
+            if x in current.values:
+                return index + current.values.index(x)
+            index += len(current.values)
+            current = current.next
+        raise ValueError(
+            f"{repr(x) if isinstance(x, str) else x} is not in linked list"
+        )
+
+    def append(self, x) -> None:
+        """
+        Adds an element `x` at the end of the linked list.
+        """
+        if not self.__tail or len(self.__tail.values) >= self.capacity:
+            node = UnrolledNode([x])
+            if not self.__tail:
+                self.__head = node
+                self.__tail = node
+            else:
+                self.__link_after(self.__tail, node)
+        else:
+            self.__tail.values.append(x)
+        self.__size += 1
+        self.shape = tuple([self.__size])
+
+    def insert(self, index: int, x) -> None:
+        """
+        Adds an element `x` at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `insert()` method of list.
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if index < 0:
+            index = max(index + self.__size, 0)
+        if index >= self.__size:
+            self.append(x)
+            return
+        current, offset = self.__locate(index)
+        if len(current.values) >= self.capacity:
+            half = len(current.values) // 2
+            self.__link_after(current, UnrolledNode(current.values[half:]))
+            del current.values[half:]
+            if offset > half:
+                current = current.next
+                offset -= half
+        current.values.insert(offset, x)
+        self.__size += 1
+        self.shape = tuple([self.__size])
+
+    def pop(self, index: Union[int, None] = None):
+        """
+        Removes and returns the element at a given `index` of the linked list.
+
+        Supports negative indexing; behaves exactly as the `pop()` method of list.
+
+        Raises `IndexError` if `index` is out of range.
+        """
+        if index is not None and not isinstance(index, int):
+            raise TypeError(
+                f"'{type(index).__name__}' object cannot be interpreted as an integer"
+            )
+        if not self.__head:
+            raise IndexError("pop from empty linked list")
+        if index is None:
+            current, offset = self.__tail, len(self.__tail.values) - 1
+        else:
+            if abs(index) > self.__size or index >= self.__size:
+                raise IndexError("pop index out of range")
+            if index < 0:
+                index += self.__size
+            current, offset = self.__locate(index)
+        value = current.values.pop(offset)
+        if not current.values:
+            self.__unlink(current)
+        elif (
+            current.next
+            and len(current.values) + len(current.next.values) <= self.capacity // 2
+        ):
+            current.values.extend(current.next.values)
+            self.__unlink(current.next)
+        self.__size -= 1
+        self.shape = tuple([self.__size])
+        return value
+
+    def remove(self, x) -> None:
+        """
+        Removes an element `x` from the linked list.
+
+        Raises `ValueError` if `x` is not present.
+        """
+        self.pop(self.index(x))
+
+    def extend(self, x: Iterable) -> None:
+        "Adds the element(s) of a linked list or an iterable `x` at the end of an existing linked list."
+        if not isinstance(x, Iterable):
+            raise TypeError(f"'{type(x).__name__}' object is an invalid type")
+        if x is self:
+            x = list(x)
+        iterator = iter(x)
+        if self.__tail and len(self.__tail.values) < self.capacity:
+            chunk = list(islice(iterator, self.capacity - len(self.__tail.values)))
+            self.__tail.values.extend(chunk)
+            self.__size += len(chunk)
+        while True:
+            chunk = list(islice(iterator, self.capacity))
+            if not chunk:
+                break
+            node = UnrolledNode(chunk)
+            if not self.__tail:
+                self.__head = node
+                self.__tail = node
+            else:
+                self.__link_after(self.__tail, node)
+            self.__size += len(chunk)
+        self.shape = tuple([self.__size])
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the elements in the linked list.
+        """
+        current = self.__tail = self.__head
+        while current:
+            current.values.reverse()
+            current.prev, current.next = current.next, current.prev
+            self.__head = current
+            current = current.prev